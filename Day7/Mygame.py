@@ -1,65 +1,77 @@
+import os
 import random
-from english_words import english_words_lower_set
+import sys
+
+# les règles du pendu sont dans ../Day9/hangman_engine.py
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Day9"))
+from hangman_engine import HangmanGame, INVALID, ALREADY, FOUND, MISSED
+
+# liste de mots chargée au premier appel seulement, puis gardée
+word_list = []
+
+def get_words():
+    if not word_list:
+        from english_words import english_words_lower_set
+        word_list.extend(english_words_lower_set)
+    return word_list
 
 def game():
     #chosen_list=["morning","python","code","work"]
     #choose a random word from my list
-    chosen_word=random.choice(list(english_words_lower_set))
+    chosen_word=random.choice(get_words())
 
     # Masquer le mot avec des "_"
-    hidden_word = ["_"] * len(chosen_word)
+    g = HangmanGame(secret=chosen_word)
 
-    penalty = 0
-    max_penalty = 12
-
-    print("You must guess the word:", " ".join(hidden_word))
+    print("You must guess the word:", g.display())
     # Boucle principale
-    while penalty <= max_penalty:
+    while not g.finished:
         input_chosen_word = input("Enter a letter or a word: ").lower()
 
-        if not input_chosen_word.isalpha():
+        result = g.guess(input_chosen_word)
+        if result == INVALID:
             print(" Just enter letters.")
             continue
+        if result == ALREADY:
+            print(f" You already tried '{input_chosen_word}'.")
+            continue
 
         # Cas mot complet
         if len(input_chosen_word) > 1:
-            if input_chosen_word == chosen_word:
+            if result == FOUND:
                 print(f"Congratulations, you found it: {chosen_word}")
                 return
             else:
-                penalty += 5
-                print(f" Wrong word! Penalties: {penalty}/{max_penalty}")
+                print(f" Wrong word! Penalties: {g.penalty}/{g.max_penalty}")
 
         # Cas lettre
         else:
-            if input_chosen_word in chosen_word:
+            if result == FOUND:
                 print(f" Letter '{input_chosen_word}' found!")
-
-                # Remplacer toutes les occurrences de la lettre
-                for i, letter in enumerate(chosen_word):
-                    if letter == input_chosen_word:
-                        hidden_word[i] = input_chosen_word
-
-            else:
-                penalty += 1
-                print(f" Wrong letter! Penalties: {penalty}/{max_penalty}")
+            elif result == MISSED:
+                print(f" Wrong letter! Penalties: {g.penalty}/{g.max_penalty}")
 
         # Afficher l'état actuel du mot
-        print(" ".join(hidden_word))
-
-        # Vérifier si le mot est complètement trouvé
-        if "".join(hidden_word) == chosen_word:
-            print(f"You win! The word was '{chosen_word}'.")
-            return
+        print(g.display())
 
-    # Si trop de pénalités
-    print(f"Game over! Too many penalties. The word was '{chosen_word}'.")
+    # Vérifier si le mot est complètement trouvé
+    if g.won:
+        print(f"You win! The word was '{chosen_word}'.")
+    else:
+        # Si trop de pénalités
+        print(f"Game over! Too many penalties. The word was '{chosen_word}'.")
 
 # Lancer le jeu
 
-while True:
-    game()
-    again = input("Do you want to play again? (y/n): ").lower()
-    if again != "y":
-        print("Thanks for playing!")
-        break
+if "--batch" in sys.argv:
+    # parties écrites dans un fichier (ou stdin), sans questions : voir ../Day9/batch.py
+    # la liste de mots n'est chargée que si un scénario utilise "?"
+    import batch
+    batch.main(sys.argv[sys.argv.index("--batch") + 1:], pick_word=lambda: random.choice(get_words()))
+else:
+    while True:
+        game()
+        again = input("Do you want to play again? (y/n): ").lower()
+        if again != "y":
+            print("Thanks for playing!")
+            break
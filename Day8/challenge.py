@@ -1,25 +1,89 @@
+import cmath
 import turtle
+from polyligne import polyligne
 
-def courbe_koch(longueur, etape):
-    """Fonction récursive pour dessiner une courbe de Von Koch
-    (une fonction récursive étant une fonction s'appelant elle-même"""
-    if etape == 0:
-        turtle.forward(longueur)
+try:
+    import numpy as np
+except ImportError:
+    np = None  # sans numpy, les sommets sont calculés avec une liste de complexes
+
+# sommets de la courbe de longueur 1 déjà calculés, par étape
+cache_koch = {}
+
+def points_koch(etape):
+    """Sommets de la courbe de Von Koch allant de 0 à 1 (nombres complexes),
+    calculés sans récursion : à chaque étape chaque segment [a, b] est remplacé
+    par les 4 segments a, a+d, a+d+d*rot, a+2d (d = (b-a)/3)"""
+    if etape in cache_koch:
+        return cache_koch[etape]
+    rot = cmath.exp(1j * cmath.pi / 3)  # tourner de 60° à gauche
+    if np is not None:
+        points = np.array([0, 1], dtype=complex)
+        for _ in range(etape):
+            a = points[:-1]
+            d = (points[1:] - a) / 3
+            nouveaux = np.empty(4 * len(a) + 1, dtype=complex)
+            nouveaux[0:-1:4] = a
+            nouveaux[1::4] = a + d
+            nouveaux[2::4] = a + d + d * rot
+            nouveaux[3::4] = a + 2 * d
+            nouveaux[-1] = points[-1]
+            points = nouveaux
     else:
-        courbe_koch(longueur/3, etape-1)
-        turtle.left(60)
-        courbe_koch(longueur/3, etape-1)
-        turtle.right(120)
-        courbe_koch(longueur/3, etape-1)
-        turtle.left(60)
-        courbe_koch(longueur/3, etape-1)
+        points = [0j, 1 + 0j]
+        for _ in range(etape):
+            nouveaux = []
+            for a, b in zip(points, points[1:]):
+                d = (b - a) / 3
+                nouveaux += [a, a + d, a + d + d * rot, a + 2 * d]
+            nouveaux.append(points[-1])
+            points = nouveaux
+    cache_koch[etape] = points
+    return points
+
+def points_depuis_tortue(longueur, etape):
+    """Sommets de la courbe partant de la position de la tortue, dans sa direction"""
+    x, y = turtle.position()
+    angle = cmath.exp(1j * cmath.pi * turtle.heading() / 180)
+    depart = complex(x, y)
+    points = points_koch(etape)
+    if np is not None:
+        return depart + longueur * angle * points
+    return [depart + longueur * angle * p for p in points]
+
+def dessiner(points):
+    """Dessine la ligne brisée d'un coup : un seul trait de la tortue pour tous
+    les sommets (voir polyligne.py), effacé par clear() / reset() comme les autres"""
+    if np is not None:
+        coords = np.empty(2 * len(points))
+        coords[0::2] = points.real
+        coords[1::2] = points.imag
+    else:
+        coords = []
+        for p in points:
+            coords += [p.real, p.imag]
+    polyligne(turtle.getturtle(), coords)
+
+def courbe_koch(longueur, etape):
+    """Courbe de Von Koch : les sommets sont calculés d'un coup
+    (voir points_koch) puis dessinés en une seule fois"""
+    ancien = turtle.tracer()
+    turtle.tracer(0)
+    dessiner(points_depuis_tortue(longueur, etape))
+    turtle.update()
+    turtle.tracer(ancien)
 
 def flocon_koch(longueur, etape):
     """Fonction pour dessiner un flocon de Von Koch
     depuis le coin haut gauche"""
+    ancien = turtle.tracer()
+    turtle.tracer(0)
     for i in range(3):
-        courbe_koch(longueur, etape)
+        dessiner(points_depuis_tortue(longueur, etape))
         turtle.right(120)
+    turtle.update()
+    turtle.tracer(ancien)
 
 if __name__ == "__main__":
     flocon_koch(100, 3)
+    turtle.done()
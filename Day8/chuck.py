@@ -1,7 +1,16 @@
-import pyjokes
+import os
+import sys
+from jokes import Paquet
 
-# Récupère une blague aléatoire (catégorie "chuck")
-joke = pyjokes.get_joke(category="chuck")
+# Paquet de blagues "chuck" mélangé : pas de répétition, même d'un lancement à l'autre
+# (la position est gardée dans ~/.cache/jokes)
+FICHIER = os.path.join(os.path.expanduser("~"), ".cache", "jokes", "chuck-en.json")
 
-print("Here is a Chuck Norris fact:")
-print(joke)
+paquet = Paquet("chuck", fichier=FICHIER)
+
+# python3 chuck.py 5 -> 5 blagues
+nombre = int(sys.argv[1]) if len(sys.argv) > 1 else 1
+
+print("Here is a Chuck Norris fact:" if nombre == 1 else "Here are some Chuck Norris facts:")
+for joke in paquet.get_jokes(nombre):
+    print(joke)
@@ -0,0 +1,59 @@
+# asset_loader.py
+# Images chargées une seule fois, converties au format de l'écran
+# (sinon chaque blit convertit les pixels) et mises à l'échelle une fois par taille.
+# Couches statiques : plusieurs éléments qui ne bougent pas (fond, potence, bonhomme)
+# dessinés une fois dans une surface, puis une image = un seul blit.
+# À utiliser après pygame.display.set_mode() (convert() a besoin de l'écran).
+
+import os
+import pygame
+
+ASSET_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets")
+
+# nom -> image convertie, taille d'origine
+_images = {}
+# (nom, taille) -> image convertie à la taille demandée
+_scaled = {}
+# (clé, taille) -> couche statique déjà dessinée
+_layers = {}
+
+def load_image(name, size=None, alpha=False):
+    """Image de assets/, convertie (convert_alpha si alpha) et à la taille size (largeur, hauteur)"""
+    key = (name, alpha)
+    image = _images.get(key)
+    if image is None:
+        image = pygame.image.load(os.path.join(ASSET_DIR, name))
+        image = image.convert_alpha() if alpha else image.convert()
+        _images[key] = image
+    if size is None or tuple(size) == image.get_size():
+        return image
+    scaled_key = (name, alpha, tuple(size))
+    scaled = _scaled.get(scaled_key)
+    if scaled is None:
+        scaled = pygame.transform.scale(image, size)
+        _scaled[scaled_key] = scaled
+    return scaled
+
+def static_layer(key, size, draw):
+    """Surface de la taille size où draw(surface) a été appelé une seule fois.
+    key : ce qui est dessiné (changer la clé quand le dessin change, ex. nombre d'erreurs)"""
+    layer_key = (key, tuple(size))
+    layer = _layers.get(layer_key)
+    if layer is None:
+        layer = pygame.Surface(size).convert()
+        draw(layer)
+        _layers[layer_key] = layer
+    return layer
+
+def forget_size(size):
+    """Oublie les images et couches d'une taille (fenêtre redimensionnée)"""
+    size = tuple(size)
+    for cache in (_scaled, _layers):
+        for key in [k for k in cache if k[-1] == size]:
+            del cache[key]
+
+def clear():
+    """Tout recharger (ex. changement de mode d'affichage, le format des pixels peut changer)"""
+    _images.clear()
+    _scaled.clear()
+    _layers.clear()
@@ -22,19 +22,21 @@ while running:
 # Quitter pygame
 pygame.quit()"""
 
-import pygame
 import os
+import sys
+import pygame
+import asset_loader
+
+# planificateur d'images partagé avec ../../Day9/hangman_pygame.py
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "Day9"))
+from frame_scheduler import FrameScheduler
 
 pygame.init()
 
 WIDTH, HEIGHT = 600, 600
-screen = pygame.display.set_mode((WIDTH, HEIGHT))
+screen = pygame.display.set_mode((WIDTH, HEIGHT), pygame.RESIZABLE)
 pygame.display.set_caption("Hangman")
 
-# Charger fond
-background_img = pygame.image.load(os.path.join("assets", "background.png"))
-background_img = pygame.transform.scale(background_img, (WIDTH, HEIGHT))
-
 
 def draw_stickman(surface, x, y):
     head_radius = 20
@@ -59,15 +61,28 @@ def draw_stickman(surface, x, y):
     pygame.draw.line(surface, color, end_body, (x + leg_length, y + 2 * head_radius + body_length + leg_length), 2)
 
 
+def draw_scene(surface):
+    # fond (converti et à la taille de la fenêtre, voir asset_loader.py) + bonhomme
+    width, height = surface.get_size()
+    surface.blit(asset_loader.load_image("background.png", (width, height)), (0, 0))
+    draw_stickman(surface, width // 2, 100)
+
+
+# la scène ne bouge pas : on attend les événements au lieu de tourner en boucle
+scheduler = FrameScheduler()
+scheduler.animate(scheduler.linger)  # premières images tout de suite
 running = True
 while running:
-    for event in pygame.event.get():
+    for event in scheduler.wait():
         if event.type == pygame.QUIT:
             running = False
+        if event.type == pygame.VIDEORESIZE:
+            # nouvelle taille : l'ancienne couche ne sert plus
+            asset_loader.forget_size(screen.get_size())
+            screen = pygame.display.set_mode(event.size, pygame.RESIZABLE)
 
-    # Affichage
-    screen.blit(background_img, (0, 0))
-    draw_stickman(screen, WIDTH // 2, 100)
+    # Affichage : la scène ne change pas, elle est dessinée une fois puis copiée en un seul blit
+    screen.blit(asset_loader.static_layer("scene", screen.get_size(), draw_scene), (0, 0))
 
     pygame.display.flip()
 pygame.quit()
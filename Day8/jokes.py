@@ -0,0 +1,107 @@
+# jokes.py
+# Blagues de pyjokes chargées une seule fois, rangées par (langue, catégorie).
+# Un Paquet donne les blagues dans un ordre mélangé sans jamais répéter
+# avant d'avoir tout donné, une par une ou par lots (get_jokes(n)).
+# La position dans le paquet peut être gardée dans un fichier entre deux lancements.
+
+import json
+import os
+import random
+import pyjokes
+
+# anciennes versions de pyjokes : pas de LANGUAGE_VALUES / CATEGORY_VALUES
+LANGUES = getattr(pyjokes, "LANGUAGE_VALUES", {"en", "de", "es", "gl", "eu", "it"})
+CATEGORIES = getattr(pyjokes, "CATEGORY_VALUES", {"neutral", "chuck", "all"})
+
+# (langue, catégorie) -> tuple de blagues, rempli au premier appel de index()
+_index = {}
+
+def index():
+    """Toutes les blagues de pyjokes, par (langue, catégorie)"""
+    if not _index:
+        for langue in LANGUES:
+            for categorie in CATEGORIES:
+                try:
+                    blagues = pyjokes.get_jokes(language=langue, category=categorie)
+                except Exception:
+                    continue  # catégorie absente dans cette langue
+                if blagues:
+                    _index[langue, categorie] = tuple(blagues)
+    return _index
+
+class Paquet:
+    """Blagues d'une catégorie dans un ordre mélangé, sans répétition.
+    Quand le paquet est fini il est mélangé à nouveau (tour suivant).
+    fichier : si donné, la position est lue au début et enregistrée après chaque tirage."""
+    def __init__(self, categorie="chuck", langue="en", fichier=None, graine=None):
+        self.blagues = index().get((langue, categorie))
+        if not self.blagues:
+            raise ValueError(f"pas de blagues pour la catégorie {categorie!r} en {langue!r}")
+        self.fichier = fichier
+        # l'ordre d'un tour ne dépend que de (graine, tour) : seules ces valeurs
+        # et la position sont enregistrées, pas la liste mélangée
+        self.graine = graine if graine is not None else random.randrange(1 << 30)
+        self.tour = 0
+        self.position = 0
+        if fichier:
+            self.charger()
+        self.ordre = self.melanger(self.tour)
+
+    def _ordre_brut(self, tour):
+        ordre = list(range(len(self.blagues)))
+        random.Random(f"{self.graine}-{tour}").shuffle(ordre)
+        return ordre
+
+    def melanger(self, tour):
+        ordre = self._ordre_brut(tour)
+        # pas la même blague à la fin d'un tour et au début du suivant
+        # (la dernière d'un tour n'est jamais déplacée, on peut la recalculer)
+        if tour and len(ordre) > 1 and ordre[0] == self._ordre_brut(tour - 1)[-1]:
+            ordre[0], ordre[1] = ordre[1], ordre[0]
+        return ordre
+
+    def charger(self):
+        try:
+            with open(self.fichier, "r", encoding="utf-8") as f:
+                etat = json.load(f)
+        except (OSError, ValueError):
+            return
+        if etat.get("nombre") != len(self.blagues):
+            return  # autre version de pyjokes : nouveau paquet
+        self.graine, self.tour, self.position = etat["graine"], etat["tour"], etat["position"]
+
+    def enregistrer(self):
+        if not self.fichier:
+            return
+        dossier = os.path.dirname(self.fichier)
+        if dossier:
+            os.makedirs(dossier, exist_ok=True)
+        with open(self.fichier, "w", encoding="utf-8") as f:
+            json.dump({"graine": self.graine, "tour": self.tour, "position": self.position,
+                       "nombre": len(self.blagues)}, f)
+
+    def _suivante(self):
+        if self.position >= len(self.ordre):
+            self.tour += 1
+            self.position = 0
+            self.ordre = self.melanger(self.tour)
+        blague = self.blagues[self.ordre[self.position]]
+        self.position += 1
+        return blague
+
+    def get_joke(self):
+        blague = self._suivante()
+        self.enregistrer()
+        return blague
+
+    def get_jokes(self, n):
+        """n blagues d'un coup (le fichier n'est écrit qu'une fois)"""
+        blagues = [self._suivante() for _ in range(n)]
+        self.enregistrer()
+        return blagues
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return self.get_joke()
@@ -0,0 +1,188 @@
+# koch_export.py
+# Export de la courbe / du flocon de Von Koch en SVG ou PNG, sans Tk ni turtle
+# (utilisable sur un serveur sans écran).
+# Les sommets sont produits par paquets au fur et à mesure et écrits tout de suite :
+# la mémoire ne dépend pas de l'étape (le PNG garde seulement l'image en mémoire).
+# Usage:
+#   python3 koch_export.py --depth 3 6 9 --size 300 800 --format svg png --out exports [--courbe] [--workers 4]
+
+import argparse
+import math
+import os
+import struct
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # sans numpy, les sommets sont produits un par un
+
+CHUNK = 1 << 16          # nombre de segments par paquet
+MARGE = 10               # marge autour du dessin, en pixels
+# direction (en sixièmes de tour) ajoutée par chaque chiffre en base 4 du numéro de segment :
+# un segment est remplacé par : tout droit, +60°, -60°, tout droit
+TOURS = (0, 1, -1, 0)
+
+def directions_python(etape, debut, fin):
+    """Direction (en sixièmes de tour) des segments debut..fin-1 de la courbe"""
+    for k in range(debut, fin):
+        d = 0
+        for _ in range(etape):
+            d += TOURS[k & 3]
+            k >>= 2
+        yield d
+
+def sommets(longueur, etape, depart=(0.0, 0.0), cap=0):
+    """Sommets de la courbe (coordonnées de la tortue, y vers le haut) par paquets.
+    cap : direction de départ en sixièmes de tour (0 = vers la droite, -2 = à droite de 120°).
+    Chaque paquet commence par le dernier sommet du paquet précédent."""
+    pas = longueur / 3 ** etape
+    total = 4 ** etape
+    x, y = depart
+    if np is not None:
+        vecteurs_x = np.array([math.cos(i * math.pi / 3) * pas for i in range(6)])
+        vecteurs_y = np.array([math.sin(i * math.pi / 3) * pas for i in range(6)])
+        chiffres = np.array(TOURS)
+        for debut in range(0, total, CHUNK):
+            k = np.arange(debut, min(debut + CHUNK, total))
+            d = np.full(len(k), cap)
+            for _ in range(etape):
+                d += chiffres[k & 3]
+                k >>= 2
+            d %= 6
+            xs = np.empty(len(d) + 1)
+            ys = np.empty(len(d) + 1)
+            xs[0], ys[0] = x, y
+            np.cumsum(vecteurs_x[d], out=xs[1:])
+            np.cumsum(vecteurs_y[d], out=ys[1:])
+            xs[1:] += x
+            ys[1:] += y
+            x, y = xs[-1], ys[-1]
+            yield xs, ys
+    else:
+        vecteurs = [(math.cos(i * math.pi / 3) * pas, math.sin(i * math.pi / 3) * pas) for i in range(6)]
+        for debut in range(0, total, CHUNK):
+            xs = [x]
+            ys = [y]
+            for d in directions_python(etape, debut, min(debut + CHUNK, total)):
+                dx, dy = vecteurs[(d + cap) % 6]
+                x += dx
+                y += dy
+                xs.append(x)
+                ys.append(y)
+            yield xs, ys
+
+def figure(longueur, etape, courbe=False):
+    """Paquets de sommets du flocon (3 courbes, comme flocon_koch) ou d'une seule courbe,
+    avec le cadre (xmin, ymin, xmax, ymax) calculé d'avance"""
+    hauteur = longueur * math.sqrt(3) / 6  # hauteur de la bosse
+    if courbe:
+        return [sommets(longueur, etape)], (0.0, 0.0, longueur, hauteur)
+    # triangle parcouru vers la droite : (0,0) -> (L,0) -> (L/2, -L*sqrt(3)/2),
+    # le flocon tient dans le cercle de rayon L/sqrt(3) autour du centre du triangle
+    coins = [(0.0, 0.0), (longueur, 0.0), (longueur / 2, -longueur * math.sqrt(3) / 2)]
+    parties = [sommets(longueur, etape, coins[i], -2 * i) for i in range(3)]
+    cx, cy = longueur / 2, -2 * hauteur / 2
+    r = longueur / math.sqrt(3)
+    return parties, (cx - r, cy - r, cx + r, cy + r)
+
+def exporter_svg(chemin, longueur, etape, courbe=False):
+    parties, (xmin, ymin, xmax, ymax) = figure(longueur, etape, courbe)
+    largeur = xmax - xmin + 2 * MARGE
+    hauteur = ymax - ymin + 2 * MARGE
+    with open(chemin, "w", encoding="utf-8", buffering=1 << 20) as f:
+        f.write(f'<svg xmlns="http://www.w3.org/2000/svg" width="{largeur:.0f}" height="{hauteur:.0f}" '
+                f'viewBox="0 0 {largeur:.2f} {hauteur:.2f}">\n')
+        f.write('<polyline fill="none" stroke="black" stroke-width="1" points="')
+        premier = True
+        for partie in parties:
+            for xs, ys in partie:
+                debut = 0 if premier else 1  # le premier sommet d'un paquet est déjà écrit
+                premier = False
+                # y vers le bas en SVG
+                f.write(" ".join(f"{x - xmin + MARGE:.2f},{ymax - y + MARGE:.2f}"
+                                 for x, y in zip(xs[debut:], ys[debut:])))
+                f.write(" ")
+        f.write('"/>\n</svg>\n')
+    return chemin
+
+def exporter_png(chemin, longueur, etape, courbe=False):
+    """Rastérise en niveaux de gris (trait noir sur fond blanc) et écrit le PNG avec zlib"""
+    parties, (xmin, ymin, xmax, ymax) = figure(longueur, etape, courbe)
+    largeur = int(math.ceil(xmax - xmin)) + 2 * MARGE
+    hauteur = int(math.ceil(ymax - ymin)) + 2 * MARGE
+    image = bytearray(b"\xff" * (largeur * hauteur))
+    for partie in parties:
+        for xs, ys in partie:
+            tracer_segments(image, largeur, hauteur, xs, ys, xmin, ymax)
+    # une ligne PNG = octet de filtre (0) + pixels
+    lignes = b"".join(b"\0" + bytes(image[y * largeur:(y + 1) * largeur]) for y in range(hauteur))
+    def bloc(type_, donnees):
+        return (struct.pack(">I", len(donnees)) + type_ + donnees
+                + struct.pack(">I", zlib.crc32(type_ + donnees) & 0xffffffff))
+    with open(chemin, "wb") as f:
+        f.write(b"\x89PNG\r\n\x1a\n")
+        f.write(bloc(b"IHDR", struct.pack(">IIBBBBB", largeur, hauteur, 8, 0, 0, 0, 0)))
+        f.write(bloc(b"IDAT", zlib.compress(lignes, 6)))
+        f.write(bloc(b"IEND", b""))
+    return chemin
+
+def tracer_segments(image, largeur, hauteur, xs, ys, xmin, ymax):
+    """Noircit les pixels des segments (points pris tous les demi-pixels le long de chaque segment)"""
+    if np is not None:
+        px = np.asarray(xs) - xmin + MARGE
+        py = ymax - np.asarray(ys) + MARGE
+        n = np.maximum(np.ceil(np.hypot(np.diff(px), np.diff(py)) * 2), 1).astype(np.int64)
+        debut = np.repeat(np.arange(len(n)), n)
+        t = (np.arange(n.sum()) - np.repeat(np.cumsum(n) - n, n)) / np.repeat(n, n)
+        x = np.round(px[debut] + t * (px[debut + 1] - px[debut])).astype(np.int64)
+        y = np.round(py[debut] + t * (py[debut + 1] - py[debut])).astype(np.int64)
+        x = np.append(x, round(px[-1]))
+        y = np.append(y, round(py[-1]))
+        ok = (x >= 0) & (x < largeur) & (y >= 0) & (y < hauteur)
+        pixels = np.frombuffer(image, dtype=np.uint8)
+        pixels[y[ok] * largeur + x[ok]] = 0
+        return
+    for i in range(len(xs) - 1):
+        x0, y0 = xs[i] - xmin + MARGE, ymax - ys[i] + MARGE
+        x1, y1 = xs[i + 1] - xmin + MARGE, ymax - ys[i + 1] + MARGE
+        n = max(1, int(math.ceil(math.hypot(x1 - x0, y1 - y0) * 2)))
+        for j in range(n + 1):
+            x = round(x0 + (x1 - x0) * j / n)
+            y = round(y0 + (y1 - y0) * j / n)
+            if 0 <= x < largeur and 0 <= y < hauteur:
+                image[y * largeur + x] = 0
+
+def exporter(travail):
+    """Un export : (format, longueur, etape, courbe, dossier) -> chemin du fichier écrit"""
+    format_, longueur, etape, courbe, dossier = travail
+    nom = f"{'courbe' if courbe else 'flocon'}_{etape}_{longueur}.{format_}"
+    chemin = os.path.join(dossier, nom)
+    if format_ == "svg":
+        return exporter_svg(chemin, longueur, etape, courbe)
+    return exporter_png(chemin, longueur, etape, courbe)
+
+def exporter_tout(travaux, workers=None):
+    """Fait les exports en parallèle (un processus par export, workers processus au plus)"""
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(exporter, travaux))
+
+def main():
+    parser = argparse.ArgumentParser(description="Export du flocon de Von Koch en SVG / PNG (sans écran)")
+    parser.add_argument("--depth", type=int, nargs="+", default=[3], help="étapes")
+    parser.add_argument("--size", type=int, nargs="+", default=[300], help="longueur d'un côté, en pixels")
+    parser.add_argument("--format", nargs="+", choices=["svg", "png"], default=["svg"])
+    parser.add_argument("--out", default=".", help="dossier de sortie")
+    parser.add_argument("--courbe", action="store_true", help="une seule courbe au lieu du flocon")
+    parser.add_argument("--workers", type=int, default=None, help="nombre de processus (défaut : un par coeur)")
+    args = parser.parse_args()
+
+    os.makedirs(args.out, exist_ok=True)
+    travaux = [(f, taille, etape, args.courbe, args.out)
+               for f in args.format for taille in args.size for etape in args.depth]
+    for chemin in exporter_tout(travaux, args.workers):
+        print(chemin)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+# polyligne.py
+# Trace une ligne brisée entière comme un seul trait turtle : un seul item du
+# canevas (au lieu d'un goto par sommet), mais gardé dans les items de la tortue,
+# donc effacé par clear() / reset() comme ses autres traits.
+# Utilisé par challenge.py (courbe de Von Koch) et recorder.py (rejeu dans Tk).
+# Une tortue qui a sa propre méthode polyligne (l'Enregistreur de recorder.py)
+# la reçoit telle quelle.
+
+def polyligne(tortue, coords, couleur=None, epaisseur=None):
+    """Trace la ligne brisée coords (x0, y0, x1, y1, ... dans les coordonnées de la
+    tortue, liste, array ou tableau numpy) avec la couleur et l'épaisseur du crayon
+    (ou celles données), puis place la tortue au dernier sommet.
+    À appeler avec tracer(0) : l'écran est mis à jour au prochain update()."""
+    if hasattr(tortue, "polyligne"):
+        tortue.polyligne(coords, couleur, epaisseur)
+        return
+    if len(coords) < 2:
+        return
+    if tortue.isdown() and len(coords) >= 4:
+        ecran = tortue.getscreen()
+        trait = ecran._createline()
+        # sous le trait en cours de la tortue, qui reste le dernier de ses items
+        tortue.items.insert(len(tortue.items) - 1, trait)
+        xs = coords[0::2]
+        ys = coords[1::2]
+        if hasattr(xs, "tolist"):
+            xs, ys = xs.tolist(), ys.tolist()
+        ecran._drawline(trait, list(zip(xs, ys)),
+                        couleur if couleur is not None else tortue._pencolor,
+                        epaisseur if epaisseur is not None else tortue._pensize)
+    # déplacer la tortue sans tracer une seconde fois
+    baisse = tortue.isdown()
+    tortue.penup()
+    tortue.goto(float(coords[-2]), float(coords[-1]))
+    if baisse:
+        tortue.pendown()
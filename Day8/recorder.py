@@ -0,0 +1,338 @@
+# recorder.py
+# Tortue "enregistreuse" : les commandes (forward, right, circle, ...) ne dessinent rien,
+# elles ajoutent des sommets à une liste d'affichage compacte (tableaux array).
+# La liste est ensuite rejouée d'un coup : dans la fenêtre turtle avec tracer(0)
+# (un trait de la tortue par trait enregistré, voir polyligne.py),
+# ou sur un canevas sans Tk (SVG ou simple compteur).
+# Usage:
+#   python3 recorder.py task2_1.py task2_3.py          # enregistre et affiche le temps
+#   python3 recorder.py task2_4.py --svg spirale.svg   # sans écran, écrit un SVG
+#   python3 recorder.py task2_2.py --tk                # rejoue dans une fenêtre turtle
+
+import argparse
+import math
+import runpy
+import sys
+import time
+import types
+from array import array
+from polyligne import polyligne
+
+def couleur_tk(couleur, colormode=1.0):
+    """(r, g, b) -> "#rrggbb", les noms de couleur sont gardés tels quels"""
+    if isinstance(couleur, tuple):
+        echelle = 255 / colormode
+        return "#%02x%02x%02x" % tuple(round(c * echelle) for c in couleur)
+    return couleur
+
+class ListeAffichage:
+    """Traits enregistrés : tous les sommets dans un seul tableau de flottants,
+    le début de chaque trait et son style (indice dans la palette) dans deux autres"""
+    def __init__(self):
+        self.coords = array("d")   # x0, y0, x1, y1, ... (coordonnées de la tortue, y vers le haut)
+        self.debuts = array("L")   # indice (en sommets) du premier sommet de chaque trait
+        self.styles = array("H")   # style de chaque trait
+        self.palette = []          # (couleur, épaisseur)
+        self.fond = None           # bgcolor de l'écran
+
+    def style(self, couleur, epaisseur):
+        cle = (couleur, epaisseur)
+        if cle not in self.palette:
+            self.palette.append(cle)
+        return self.palette.index(cle)
+
+    def nouveau_trait(self, x, y, style):
+        self.debuts.append(len(self.coords) // 2)
+        self.styles.append(style)
+        self.coords.append(x)
+        self.coords.append(y)
+
+    def ajouter(self, x, y):
+        self.coords.append(x)
+        self.coords.append(y)
+
+    def __len__(self):
+        """Nombre de segments"""
+        return len(self.coords) // 2 - len(self.debuts)
+
+    def traits(self):
+        """(coords du trait, couleur, épaisseur) pour chaque trait d'au moins un segment"""
+        fins = list(self.debuts[1:]) + [len(self.coords) // 2]
+        for debut, fin, style in zip(self.debuts, fins, self.styles):
+            if fin - debut > 1:
+                couleur, epaisseur = self.palette[style]
+                yield self.coords[2 * debut:2 * fin], couleur, epaisseur
+
+    def rejouer(self, canevas):
+        """Un create_line par trait, l'axe y du canevas va vers le bas"""
+        if self.fond is not None and hasattr(canevas, "configure"):
+            canevas.configure(bg=self.fond)
+        for coords, couleur, epaisseur in self.traits():
+            points = array("d", coords)
+            for i in range(1, len(points), 2):
+                points[i] = -points[i]
+            canevas.create_line(points.tolist(), fill=couleur, width=epaisseur)
+
+    def rejouer_tk(self, module_turtle=None):
+        """Rejoue dans la fenêtre turtle en une seule mise à jour, chaque trait
+        devient un trait de la tortue (clear() / reset() l'effacent)"""
+        if module_turtle is None:
+            import turtle as module_turtle
+        ancien = module_turtle.tracer()
+        module_turtle.tracer(0)
+        if self.fond is not None:
+            module_turtle.bgcolor(self.fond)
+        tortue = module_turtle.getturtle()
+        tortue.hideturtle()
+        tortue.pendown()
+        for coords, couleur, epaisseur in self.traits():
+            polyligne(tortue, coords, couleur, epaisseur)
+        module_turtle.update()
+        module_turtle.tracer(ancien)
+
+class Enregistreur:
+    """Remplace turtle.Turtle : même position et direction que la vraie tortue
+    (mode "standard"), mais les traits vont dans une ListeAffichage"""
+    def __init__(self, liste=None):
+        self.liste = liste if liste is not None else ListeAffichage()
+        self.x = 0.0
+        self.y = 0.0
+        self.angle = 0.0
+        self.crayon = True
+        self.couleur = "black"
+        self.epaisseur = 1
+        self.colormode = 1.0
+        self.trait_en_cours = False
+
+    # ---------- déplacements ----------
+    def goto(self, x, y=None):
+        if y is None:
+            x, y = x
+        if self.crayon:
+            if not self.trait_en_cours:
+                self.liste.nouveau_trait(self.x, self.y, self.liste.style(self.couleur, self.epaisseur))
+                self.trait_en_cours = True
+            self.liste.ajouter(x, y)
+        self.x, self.y = float(x), float(y)
+
+    def forward(self, distance):
+        a = math.radians(self.angle)
+        self.goto(self.x + distance * math.cos(a), self.y + distance * math.sin(a))
+
+    def back(self, distance):
+        self.forward(-distance)
+
+    def left(self, angle):
+        self.angle = (self.angle + angle) % 360
+
+    def right(self, angle):
+        self.left(-angle)
+
+    def setheading(self, angle):
+        self.angle = angle % 360
+
+    def home(self):
+        self.goto(0, 0)
+        self.angle = 0.0
+
+    def polyligne(self, coords, couleur=None, epaisseur=None):
+        """Ligne brisée entière (voir polyligne.py) : un seul trait de la liste"""
+        if hasattr(coords, "tolist"):
+            coords = coords.tolist()
+        if self.crayon and len(coords) >= 4:
+            couleur = couleur_tk(couleur, self.colormode) if couleur is not None else self.couleur
+            style = self.liste.style(couleur, epaisseur if epaisseur is not None else self.epaisseur)
+            self.liste.nouveau_trait(coords[0], coords[1], style)
+            self.liste.coords.extend(coords[2:])
+            # le goto suivant commence un autre trait
+            self.trait_en_cours = False
+        if len(coords) >= 2:
+            self.x, self.y = float(coords[-2]), float(coords[-1])
+
+    def circle(self, radius, extent=None, steps=None):
+        """Même polygone que turtle.circle"""
+        if extent is None:
+            extent = 360
+        if steps is None:
+            frac = abs(extent) / 360
+            steps = 1 + int(min(11 + abs(radius) / 6.0, 59.0) * frac)
+        w = extent / steps
+        longueur = 2.0 * radius * math.sin(math.radians(w / 2))
+        if radius < 0:
+            longueur, w = -longueur, -w
+        self.left(w / 2)
+        for _ in range(steps):
+            self.forward(longueur)
+            self.left(w)
+        self.left(-w / 2)
+
+    # ---------- crayon ----------
+    def _changer_style(self):
+        # le trait suivant commence au point actuel avec le nouveau style
+        self.trait_en_cours = False
+
+    def penup(self):
+        self.crayon = False
+        self._changer_style()
+
+    def pendown(self):
+        self.crayon = True
+
+    def isdown(self):
+        return self.crayon
+
+    def pencolor(self, *couleur):
+        if not couleur:
+            return self.couleur
+        self.couleur = couleur_tk(couleur if len(couleur) == 3 else couleur[0], self.colormode)
+        self._changer_style()
+
+    def color(self, *couleurs):
+        if not couleurs:
+            return self.couleur, self.couleur
+        self.pencolor(couleurs[0])
+
+    def pensize(self, epaisseur=None):
+        if epaisseur is None:
+            return self.epaisseur
+        self.epaisseur = epaisseur
+        self._changer_style()
+
+    def position(self):
+        return (self.x, self.y)
+
+    def heading(self):
+        return self.angle
+
+    fd = forward
+    bk = backward = back
+    lt = left
+    rt = right
+    seth = setheading
+    setpos = setposition = goto
+    pu = up = penup
+    pd = down = pendown
+    width = pensize
+    pos = position
+
+    def __getattr__(self, nom):
+        # speed, hideturtle, shape, ... ne changent pas le dessin
+        return lambda *args, **kwargs: None
+
+class EcranEnregistreur:
+    """Remplace turtle.Screen : garde la couleur de fond, mainloop / exitonclick ne bloquent pas"""
+    def __init__(self, liste):
+        self.liste = liste
+
+    def bgcolor(self, *couleur):
+        if couleur:
+            self.liste.fond = couleur_tk(couleur if len(couleur) == 3 else couleur[0])
+        return self.liste.fond
+
+    def tracer(self, *args):
+        return 0
+
+    def __getattr__(self, nom):
+        return lambda *args, **kwargs: None
+
+def module_enregistreur(liste):
+    """Faux module turtle : Screen(), Turtle() et les fonctions du module
+    (turtle.forward, ...) enregistrent tous dans la même liste"""
+    module = types.ModuleType("turtle")
+    ecran = EcranEnregistreur(liste)
+    tortue = Enregistreur(liste)
+    module.Screen = lambda: ecran
+    module.getturtle = module.getpen = lambda: tortue
+    module.Turtle = module.Pen = module.RawTurtle = lambda *args, **kwargs: Enregistreur(liste)
+    module.liste = liste
+    def __getattr__(nom):
+        if hasattr(EcranEnregistreur, nom):
+            return getattr(ecran, nom)
+        return getattr(tortue, nom)
+    module.__getattr__ = __getattr__
+    return module
+
+def enregistrer(script):
+    """Exécute un script turtle avec le faux module et renvoie sa liste d'affichage"""
+    liste = ListeAffichage()
+    ancien = sys.modules.get("turtle")
+    sys.modules["turtle"] = module_enregistreur(liste)
+    try:
+        runpy.run_path(script, run_name="__main__")
+    finally:
+        if ancien is not None:
+            sys.modules["turtle"] = ancien
+        else:
+            del sys.modules["turtle"]
+    return liste
+
+class CanevasCompteur:
+    """Canevas sans Tk : compte les traits et les segments"""
+    def __init__(self):
+        self.traits = 0
+        self.segments = 0
+
+    def create_line(self, coords, **options):
+        self.traits += 1
+        self.segments += len(coords) // 2 - 1
+
+class CanevasSVG:
+    """Canevas sans Tk qui garde les create_line pour les écrire en SVG"""
+    def __init__(self):
+        self.lignes = []
+        self.fond = None
+
+    def configure(self, bg=None, **options):
+        self.fond = bg
+
+    def create_line(self, coords, fill="black", width=1):
+        self.lignes.append((coords, fill, width))
+
+    def enregistrer(self, chemin, marge=10):
+        xs = [x for coords, _, _ in self.lignes for x in coords[0::2]] or [0]
+        ys = [y for coords, _, _ in self.lignes for y in coords[1::2]] or [0]
+        xmin, ymin = min(xs) - marge, min(ys) - marge
+        largeur, hauteur = max(xs) - xmin + marge, max(ys) - ymin + marge
+        with open(chemin, "w", encoding="utf-8") as f:
+            f.write(f'<svg xmlns="http://www.w3.org/2000/svg" width="{largeur:.0f}" height="{hauteur:.0f}" '
+                    f'viewBox="{xmin:.2f} {ymin:.2f} {largeur:.2f} {hauteur:.2f}">\n')
+            if self.fond:
+                f.write(f'<rect x="{xmin:.2f}" y="{ymin:.2f}" width="100%" height="100%" fill="{self.fond}"/>\n')
+            for coords, couleur, epaisseur in self.lignes:
+                points = " ".join(f"{coords[i]:.2f},{coords[i + 1]:.2f}" for i in range(0, len(coords), 2))
+                f.write(f'<polyline fill="none" stroke="{couleur}" stroke-width="{epaisseur}" points="{points}"/>\n')
+            f.write("</svg>\n")
+
+def main():
+    parser = argparse.ArgumentParser(description="Enregistre des scripts turtle et les rejoue d'un coup")
+    parser.add_argument("scripts", nargs="+")
+    parser.add_argument("--tk", action="store_true", help="rejouer dans une fenêtre turtle")
+    parser.add_argument("--svg", help="écrire le dessin en SVG (un seul script)")
+    args = parser.parse_args()
+
+    for script in args.scripts:
+        t = time.perf_counter()
+        liste = enregistrer(script)
+        duree = time.perf_counter() - t
+        canevas = CanevasCompteur()
+        t = time.perf_counter()
+        liste.rejouer(canevas)
+        duree_rejeu = time.perf_counter() - t
+        print(f"{script}: {canevas.traits} traits, {len(liste)} segments, "
+              f"enregistré en {duree * 1000:.2f} ms, rejoué en {duree_rejeu * 1000:.2f} ms")
+        if args.svg:
+            svg = CanevasSVG()
+            liste.rejouer(svg)
+            svg.enregistrer(args.svg)
+        if args.tk:
+            import turtle
+            turtle.clearscreen()
+            if liste.fond is not None:
+                turtle.bgcolor(liste.fond)
+            liste.rejouer_tk(turtle)
+    if args.tk:
+        import turtle
+        turtle.done()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+# autocomplete.py
+# Suggestions for the word typed in hangman_pygame.py: words starting with the typed
+# letters that still fit the game (same length, revealed letters in place, no used
+# letter on a hidden position, since a found letter is revealed everywhere).
+#
+# The trie is kept implicit to stay compact: the words of each length are sorted once,
+# a trie node is a range [lo, hi) of that list at a given depth (all the words of the
+# range share their first `depth` letters), and its children are found with bisect.
+# No node objects, the only memory used is the sorted lists.
+
+from bisect import bisect_left, bisect_right
+from operator import itemgetter
+
+class Autocomplete:
+    def __init__(self, words):
+        groups = {}
+        for w in words:
+            groups.setdefault(len(w), set()).add(w)
+        self.by_length = {n: sorted(ws) for n, ws in groups.items()}
+        self.keys = {}      # depth -> key function for bisect (letter at depth)
+        self._last = None   # (query, result) of the last call, a frame often asks again
+
+    def _key(self, depth):
+        key = self.keys.get(depth)
+        if key is None:
+            key = self.keys[depth] = itemgetter(depth)
+        return key
+
+    def suggest(self, prefix, hidden, used, limit=5):
+        """Up to limit words (alphabetical) starting with prefix that fit the pattern
+        hidden (list of letters / "_") and the used letters."""
+        query = (prefix, tuple(hidden), frozenset(used), limit)
+        if self._last is not None and self._last[0] == query:
+            return self._last[1]
+        result = []
+        words = self.by_length.get(len(hidden))
+        if words and len(prefix) <= len(hidden):
+            self._walk(words, 0, len(words), 0, prefix, hidden, used, limit, result)
+        self._last = (query, result)
+        return result
+
+    def _walk(self, words, lo, hi, depth, prefix, hidden, used, limit, result):
+        if depth == len(hidden):
+            result.append(words[lo])
+            return
+        key = self._key(depth)
+        shown = hidden[depth]
+        typed = prefix[depth] if depth < len(prefix) else None
+        if shown != "_":
+            if typed is not None and typed != shown:
+                return
+            allowed = shown
+        elif typed is not None:
+            if typed in used:
+                return
+            allowed = typed
+        else:
+            allowed = None  # any letter not used yet
+        if allowed is not None:
+            # one child: the words of the range with this letter at depth
+            start = bisect_left(words, allowed, lo, hi, key=key)
+            end = bisect_right(words, allowed, start, hi, key=key)
+            if start < end:
+                self._walk(words, start, end, depth + 1, prefix, hidden, used, limit, result)
+            return
+        # every child of the node, in alphabetical order
+        while lo < hi and len(result) < limit:
+            letter = words[lo][depth]
+            end = bisect_right(words, letter, lo, hi, key=key)
+            if letter not in used:
+                self._walk(words, lo, end, depth + 1, prefix, hidden, used, limit, result)
+            lo = end
@@ -0,0 +1,99 @@
+# batch.py
+# Batch mode for the terminal games (hangman.py, ../Day7/Mygame.py):
+# plays scripted games back to back, without prompts, and prints one result line per game.
+#   python3 hangman.py [words.txt] --batch scenarios.txt [--format tsv|jsonl]
+#   cat scenarios.txt | python3 ../Day7/Mygame.py --batch -
+#
+# Scenario file: one game per line, the secret word then the guesses, separated by spaces.
+# "?" as the secret picks a random word from the word list (loaded once).
+# Empty lines and lines starting with "#" are skipped.
+#   school e a o s c h l
+#   python java python
+#   ? e t a o i n s h r d l u
+#
+# Result (tsv): line, secret, won|lost|unfinished, attempts, penalty, guesses played, word shown
+# jsonl: the same fields as a JSON object per line. A summary goes to stderr.
+
+import io
+import json
+import sys
+import time
+from hangman_engine import HangmanGame
+
+FIELDS = ["line", "secret", "result", "attempts", "penalty", "guesses", "word"]
+
+def parse_scenarios(lines):
+    """(line number, secret, guesses) for each scenario line."""
+    for number, line in enumerate(lines, 1):
+        parts = line.split()
+        if not parts or parts[0].startswith("#"):
+            continue
+        yield number, parts[0].lower(), parts[1:]
+
+def run_batch(lines, out, pick_word=None, skip_too_long=False, fmt="tsv", log=None):
+    """Play every scenario of lines, write one result per game to out.
+    pick_word: function returning a random word, for the "?" secrets.
+    skip_too_long: guesses longer than the secret are ignored (rule of hangman.py).
+    Returns (games, wins)."""
+    game = HangmanGame(secret="a", clock=lambda: 0.0, log=log)
+    games = wins = 0
+    for number, secret, guesses in parse_scenarios(lines):
+        if secret == "?":
+            if pick_word is None:
+                raise ValueError(f"line {number}: '?' needs a word list")
+            secret = pick_word()
+        game.reset_round(secret)
+        played = 0
+        for text in guesses:
+            if game.finished:
+                break
+            if skip_too_long and len(text) > 1 and len(text) > len(secret):
+                continue
+            game.guess(text)
+            played += 1
+        result = "won" if game.won else "lost" if game.finished else "unfinished"
+        row = [number, secret, result, game.attempts, game.penalty, played, "".join(game.hidden)]
+        if fmt == "jsonl":
+            out.write(json.dumps(dict(zip(FIELDS, row))) + "\n")
+        else:
+            out.write("\t".join(map(str, row)) + "\n")
+        games += 1
+        wins += game.won
+    return games, wins
+
+def main(argv, pick_word=None, skip_too_long=False, log=None):
+    """Batch mode from the command line arguments after --batch: <file or -> [--format tsv|jsonl]."""
+    if not argv:
+        print("Usage: --batch <scenarios.txt or -> [--format tsv|jsonl]")
+        sys.exit(1)
+    source = argv[0]
+    fmt = "tsv"
+    if "--format" in argv:
+        fmt = argv[argv.index("--format") + 1]
+    if fmt not in ("tsv", "jsonl"):
+        print(f"Error: unknown format '{fmt}' (tsv or jsonl)")
+        sys.exit(1)
+    if source == "-":
+        lines = io.TextIOWrapper(sys.stdin.buffer, encoding="utf-8", errors="replace")
+    else:
+        try:
+            lines = open(source, "r", encoding="utf-8", errors="replace", buffering=1 << 20)
+        except OSError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+    # results are written through a large buffer, not line by line
+    sys.stdout.flush()
+    raw = io.FileIO(sys.stdout.fileno(), "w", closefd=False)
+    out = io.TextIOWrapper(io.BufferedWriter(raw, 1 << 20), encoding="utf-8")
+    start = time.perf_counter()
+    try:
+        with lines:
+            games, wins = run_batch(lines, out, pick_word, skip_too_long, fmt, log)
+    except ValueError as e:
+        out.flush()
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    out.flush()
+    elapsed = time.perf_counter() - start
+    rate = games / elapsed if elapsed else 0
+    print(f"{games} games, {wins} won, {elapsed:.3f} s ({rate:,.0f} games/s)", file=sys.stderr)
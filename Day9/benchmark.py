@@ -0,0 +1,295 @@
+# benchmark.py
+# Benchmark suite for the hangman projects, runs without a window
+# (SDL dummy video driver, turtle replaced by a counting fake).
+# Usage:
+#   python3 benchmark.py [words.txt] [--only engine,load,...] [--games N]
+#   python3 benchmark.py --save baseline.json      # record a baseline
+#   python3 benchmark.py --compare baseline.json   # fail if slower than the baseline
+#
+# Benchmarks: engine (games/s), guess, load (load_wordlist_from_file),
+# frame (one frame of the main() render path), scores (get_best_score as
+# the score file grows), koch (courbe_koch at increasing depths, real turtle
+# on a stub canvas), sessions (bytes per game session kept in memory,
+# 1M compact sessions).
+
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import argparse
+import json
+import random
+import sys
+import tempfile
+import time
+from hangman_engine import HangmanGame
+from word_pool import WordPool, DEFAULT_WORDS
+
+ALPHABET = "abcdefghijklmnopqrstuvwxyz"
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+def load_words(path):
+    if path is None:
+        return DEFAULT_WORDS
+    with open(path, "r", encoding="utf-8") as f:
+        return [line.strip().lower() for line in f if line.strip().isalpha()]
+
+def best_time(fn, repeat=5, number=1):
+    """Best time of `repeat` runs, in seconds per call."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        times.append((time.perf_counter() - start) / number)
+    return min(times)
+
+def random_words(count, seed=0):
+    rng = random.Random(seed)
+    return ["".join(rng.choices(ALPHABET, k=rng.randint(3, 12))) for _ in range(count)]
+
+# ---------- Benchmarks ----------
+# each one returns {name: seconds per operation (or bytes for *.bytes)}, lower is better
+
+def bench_engine(words, games, seed=0):
+    """Play `games` rounds guessing letters in random order.
+    Returns (games per second, win rate)."""
+    rng = random.Random(seed)
+    game = HangmanGame(WordPool(words, rng=rng), clock=lambda: 0.0, rng=rng)
+    letters = list(ALPHABET)
+    wins = 0
+    start = time.perf_counter()
+    for _ in range(games):
+        game.reset_round()
+        rng.shuffle(letters)
+        for letter in letters:
+            game.guess(letter)
+            if game.finished:
+                break
+        wins += game.won
+    elapsed = time.perf_counter() - start
+    return games / elapsed, wins / games
+
+def run_engine(args, words):
+    rate, win_rate = bench_engine(words, args.games, args.seed)
+    print(f"  engine: {rate:,.0f} games/s ({rate*60:,.0f} games/min), win rate {win_rate:.1%}")
+    return {"engine.game": 1 / rate}
+
+def run_guess(args, words):
+    game = HangmanGame(secret="abcdefghijklm", clock=lambda: 0.0)
+    game.max_penalty = 10**9
+    def one_round():
+        game.reset_round("abcdefghijklm")
+        for letter in ALPHABET:
+            game.guess(letter)
+    return {"guess": best_time(one_round, number=2000) / len(ALPHABET)}
+
+def run_load(args, words):
+    import hangman_pygame
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for count in (10_000, 100_000, 1_000_000):
+            path = os.path.join(tmp, f"words{count}.txt")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write("\n".join(random_words(count)) + "\n")
+            results[f"load.{count}"] = best_time(lambda: hangman_pygame.load_wordlist_from_file(path), repeat=3)
+    return results
+
+def run_frame(args, words):
+    import pygame
+    import hangman_pygame
+    if hangman_pygame.screen is None:
+        hangman_pygame.init_display()
+    screen = hangman_pygame.screen
+    game = hangman_pygame.HangmanGame(WordPool(words), time_limit=60)
+    game.guess("e")
+    game.guess("q")
+    def full_frame():
+        hangman_pygame.draw_game(screen, game, "ab")
+        pygame.display.flip()
+    renderer = hangman_pygame.DirtyRenderer(screen)
+    renderer.render(game, "")
+    buffers = ["a", "ab"]
+    state = [0]
+    def dirty_frame():
+        # the typed buffer changes every frame, the rest stays the same
+        state[0] ^= 1
+        renderer.render(game, buffers[state[0]])
+    return {
+        "frame.full": best_time(full_frame, number=50),
+        "frame.dirty": best_time(dirty_frame, number=50),
+    }
+
+def run_scores(args, words):
+    from score_store import ScoreStore, format_line
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for count in (1_000, 10_000, 100_000):
+            path = os.path.join(tmp, f"best_scores{count}")
+            with open(path, "w", encoding="utf-8") as f:
+                f.writelines(format_line(w, 20 + i % 50) for i, w in enumerate(random_words(count)))
+            results[f"scores.cold.{count}"] = best_time(lambda: ScoreStore(path).best(), repeat=3)
+            store = ScoreStore(path)
+            store.best()
+            results[f"scores.cached.{count}"] = best_time(store.best, number=1000)
+    return results
+
+def run_sessions(args, words):
+    """Memory of game sessions kept in memory: HangmanGame vs CompactGame."""
+    import tracemalloc
+    from compact_session import CompactGame, RECORD, dump_sessions, load_sessions, dumps, loads
+    pool = WordPool(words, rng=random.Random(args.seed))
+    def measure(make, count):
+        tracemalloc.start()
+        sessions = [make() for _ in range(count)]
+        size = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        return sessions, size / count
+    def compact():
+        game = CompactGame.new(pool)
+        game.guess("e")
+        game.guess("a")
+        return game
+    def full():
+        game = HangmanGame(pool, clock=lambda: 0.0)
+        game.guess("e")
+        game.guess("a")
+        return game
+    # HangmanGame is measured on fewer sessions, 1M of them would take gigabytes
+    _, full_bytes = measure(full, 100_000)
+    sessions, compact_bytes = measure(compact, 1_000_000)
+    print(f"  HangmanGame {full_bytes:,.0f} bytes/session, CompactGame {compact_bytes:,.0f} bytes/session "
+          f"({compact_bytes * 1e6 / 2**20:,.0f} MiB for 1M sessions)")
+    snapshot = dump_sessions(sessions)
+    assert loads(dumps(sessions[0], pool), pool).to_bytes() == sessions[0].to_bytes()
+    assert load_sessions(snapshot[:RECORD.size], pool)[0].secret == sessions[0].secret
+    return {
+        "sessions.full.bytes": full_bytes,
+        "sessions.compact.bytes": compact_bytes,
+        "sessions.dump": best_time(lambda: dump_sessions(sessions), repeat=3) / len(sessions),
+        "sessions.load": best_time(lambda: load_sessions(snapshot, pool), repeat=3) / len(sessions),
+    }
+
+class StubCanvas:
+    """Stands in for the Tk canvas of turtle.TurtleScreen: counts the calls, draws nothing."""
+    def __init__(self):
+        self.calls = 0
+        self.items = 0
+    def cget(self, option):
+        return 400
+    def winfo_width(self):
+        return 400
+    def winfo_height(self):
+        return 400
+    def create_item(self, *args, **kwargs):
+        self.calls += 1
+        self.items += 1
+        return self.items
+    create_line = create_polygon = create_image = create_text = create_item
+    def coords(self, item, *args):
+        self.calls += 1
+        return []
+    def __getattr__(self, name):
+        # any other canvas call (itemconfigure, delete, update, ...) does nothing
+        def call(*args, **kwargs):
+            self.calls += 1
+        return call
+
+def stub_turtle_module():
+    """Module-like object for challenge.py: a real RawTurtle on a StubCanvas, so the
+    whole turtle drawing path is timed (only Tk itself is left out)."""
+    import turtle
+    class StubScreen(turtle.TurtleScreen):
+        def _blankimage(self):
+            return None  # needs a Tk photo image
+    screen = StubScreen(StubCanvas())
+    pen = turtle.RawTurtle(screen)
+    class Module:
+        def getturtle(self):
+            return pen
+        def __getattr__(self, name):
+            # turtle.forward, turtle.tracer, ...: the pen first, then the screen
+            return getattr(pen if hasattr(pen, name) else screen, name)
+    return Module()
+
+def run_koch(args, words):
+    sys.path.insert(0, os.path.join(HERE, "..", "Day8"))
+    import challenge
+    challenge.turtle = stub_turtle_module()
+    def draw(depth):
+        # cold: the vertices are computed again for every run
+        getattr(challenge, "cache_koch", {}).clear()
+        challenge.turtle.clear()
+        challenge.courbe_koch(300, depth)
+    results = {}
+    for depth in (3, 5, 7, 9):
+        results[f"koch.{depth}"] = best_time(lambda: draw(depth), repeat=3)
+    return results
+
+BENCHMARKS = {
+    "engine": run_engine,
+    "guess": run_guess,
+    "load": run_load,
+    "frame": run_frame,
+    "scores": run_scores,
+    "koch": run_koch,
+    "sessions": run_sessions,
+}
+
+# ---------- Baseline ----------
+def compare(results, baseline, tolerance):
+    """Print the ratio to the baseline, returns the names that got slower."""
+    slower = []
+    for name, seconds in sorted(results.items()):
+        base = baseline.get(name)
+        if base is None:
+            continue
+        ratio = seconds / base
+        flag = ""
+        if ratio > 1 + tolerance:
+            flag = "  <-- REGRESSION"
+            slower.append(name)
+        print(f"  {name:24s} {ratio:6.2f}x baseline{flag}")
+    return slower
+
+def main():
+    parser = argparse.ArgumentParser(description="Hangman benchmark suite")
+    parser.add_argument("words", nargs="?", help="word list file (default: built-in list)")
+    parser.add_argument("--only", help="comma separated list of: " + ",".join(BENCHMARKS))
+    parser.add_argument("--games", type=int, default=200000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--save", metavar="FILE", help="save the results as a baseline (JSON)")
+    parser.add_argument("--compare", metavar="FILE", help="compare with a saved baseline")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed slowdown (default 0.2 = 20%%)")
+    args = parser.parse_args()
+
+    words = load_words(args.words)
+    names = args.only.split(",") if args.only else list(BENCHMARKS)
+    results = {}
+    for name in names:
+        if name not in BENCHMARKS:
+            parser.error(f"unknown benchmark: {name}")
+        print(f"{name}:")
+        part = BENCHMARKS[name](args, words)
+        for key, value in part.items():
+            if key.endswith(".bytes"):
+                print(f"  {key:24s} {value:12.1f} B")
+            else:
+                print(f"  {key:24s} {value * 1e6:12.2f} us")
+        results.update(part)
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+        print(f"baseline saved to {args.save}")
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        print(f"compared to {args.compare}:")
+        slower = compare(results, baseline, args.tolerance)
+        if slower:
+            print("slower than the baseline: " + ", ".join(slower))
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
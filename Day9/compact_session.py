@@ -0,0 +1,169 @@
+# compact_session.py
+# Small game session for servers keeping a very large number of games in memory.
+# Same rules as HangmanGame (hangman_engine.py), but the state is only a few ints:
+# no __dict__, the secret is an index into the word pool given to new() (one
+# reference, the pool is shared), the used letters are a 26-bit mask and the
+# revealed positions a 64-bit mask: secrets are limited to MAX_LENGTH letters
+# (new() refuses longer words).
+# A session is 19 bytes once serialized (to_bytes / dump_sessions), the pool is
+# left out and given back to from_bytes / load_sessions. Pickle works the same
+# way: dumps(obj, pool) / loads(data, pool) replace the pool by a reference,
+# a plain pickle.dumps of a session is refused (it would copy the whole pool).
+# Only the letters a-z can be guessed (the word lists are filtered the same way).
+
+import io
+import pickle
+import random
+import struct
+from hangman_engine import (MAX_PENALTY, LETTER_PENALTY, WORD_PENALTY, HINT_PENALTY,
+                            INVALID, ALREADY, FOUND, MISSED, OVER)
+
+# index, used letters, revealed positions, penalty, attempts
+RECORD = struct.Struct("<IIQBH")
+MAX_LENGTH = 64  # bits of the revealed positions in RECORD
+
+class CompactGame:
+    __slots__ = ("pool", "index", "used", "revealed", "penalty", "attempts")
+
+    @classmethod
+    def new(cls, pool, difficulty="medium"):
+        index = pool.draw_index(difficulty)
+        if len(pool.words[index]) > MAX_LENGTH:
+            raise ValueError(f"secret longer than {MAX_LENGTH} letters: {pool.words[index][:20]}...")
+        return cls(pool, index)
+
+    def __init__(self, pool, index, used=0, revealed=0, penalty=0, attempts=0):
+        self.pool = pool
+        self.index = index
+        self.used = used
+        self.revealed = revealed
+        self.penalty = penalty
+        self.attempts = attempts
+
+    @property
+    def secret(self):
+        return self.pool.words[self.index]
+
+    @property
+    def won(self):
+        return self.revealed == (1 << len(self.secret)) - 1
+
+    @property
+    def finished(self):
+        return self.penalty >= MAX_PENALTY or self.won
+
+    def positions(self, letter):
+        """Bitmask of the positions of letter in the secret (computed, not stored)."""
+        mask = 0
+        for i, c in enumerate(self.secret):
+            if c == letter:
+                mask |= 1 << i
+        return mask
+
+    def guess(self, text):
+        if self.finished:
+            return OVER
+        text = text.lower().strip()
+        if not text or not text.isascii() or not text.isalpha():
+            return INVALID
+        if len(text) > 1:
+            self.attempts += 1
+            if text == self.secret:
+                self.revealed = (1 << len(text)) - 1
+                return FOUND
+            self.penalty += WORD_PENALTY
+            return MISSED
+        bit = 1 << (ord(text) - 97)
+        if self.used & bit:
+            return ALREADY
+        self.used |= bit
+        self.attempts += 1
+        mask = self.positions(text) & ~self.revealed
+        if mask:
+            self.revealed |= mask
+            return FOUND
+        self.penalty += LETTER_PENALTY
+        return MISSED
+
+    def hint(self, letter=None, rng=random):
+        """Reveal one unseen letter, costs HINT_PENALTY attempts (see HangmanGame.hint)."""
+        if self.finished:
+            return None
+        if letter is None:
+            unrevealed = [c for i, c in enumerate(self.secret) if not self.revealed >> i & 1]
+            letter = rng.choice(unrevealed)
+        self.used |= 1 << (ord(letter) - 97)
+        self.revealed |= self.positions(letter)
+        self.attempts += HINT_PENALTY
+        return letter
+
+    @property
+    def used_letters(self):
+        return {chr(97 + i) for i in range(26) if self.used >> i & 1}
+
+    @property
+    def hidden(self):
+        return [c if self.revealed >> i & 1 else "_" for i, c in enumerate(self.secret)]
+
+    def display(self):
+        return " ".join(self.hidden)
+
+    # ---------- serialization ----------
+    def to_bytes(self):
+        return RECORD.pack(self.index, self.used, self.revealed, self.penalty, self.attempts)
+
+    @classmethod
+    def from_bytes(cls, data, pool):
+        return cls(pool, *RECORD.unpack(data))
+
+    def __reduce__(self):
+        raise TypeError("pickle sessions with compact_session.dumps(obj, pool), "
+                        "a plain pickle would copy the word pool")
+
+    def _reduce(self):
+        # the record + the pool, that SessionPickler replaces by a reference
+        return (type(self).from_bytes, (self.to_bytes(), self.pool))
+
+def dump_sessions(sessions):
+    """Snapshot of many sessions: the records one after the other."""
+    return b"".join([s.to_bytes() for s in sessions])
+
+def load_sessions(data, pool, cls=CompactGame):
+    """Sessions of a dump_sessions snapshot, playing on pool (the pool of the dump)."""
+    return [cls(pool, *fields) for fields in RECORD.iter_unpack(data)]
+
+class SessionPickler(pickle.Pickler):
+    """Pickler for objects holding sessions: each session is its record, the pool
+    is written as a reference and given back to SessionUnpickler."""
+    def __init__(self, file, pool, protocol=None):
+        super().__init__(file, protocol)
+        self.pool = pool
+
+    def reducer_override(self, obj):
+        if isinstance(obj, CompactGame):
+            if obj.pool is not self.pool:
+                raise pickle.PicklingError("session of another word pool")
+            return obj._reduce()
+        return NotImplemented
+
+    def persistent_id(self, obj):
+        return "pool" if obj is self.pool else None
+
+class SessionUnpickler(pickle.Unpickler):
+    def __init__(self, file, pool):
+        super().__init__(file)
+        self.pool = pool
+
+    def persistent_load(self, pid):
+        if pid != "pool":
+            raise pickle.UnpicklingError(f"unknown reference {pid!r}")
+        return self.pool
+
+def dumps(obj, pool):
+    """pickle.dumps for objects holding sessions of pool (the pool is left out)."""
+    f = io.BytesIO()
+    SessionPickler(f, pool).dump(obj)
+    return f.getvalue()
+
+def loads(data, pool):
+    return SessionUnpickler(io.BytesIO(data), pool).load()
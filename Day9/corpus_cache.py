@@ -0,0 +1,152 @@
+# corpus_cache.py
+# Compiled word list: a binary file next to the text word list (words.txt -> words.txt.hmc)
+# that is memory-mapped at startup instead of parsing the text again.
+# It is rebuilt automatically when the source file size or mtime changes.
+# Build step (optional, the cache is also built on first use):
+#   python3 corpus_cache.py words.txt [more.txt ...]
+#
+# File layout (little-endian, 8-byte aligned):
+#   header        magic, max word length, source size, source mtime (ns), word count, blob size
+#   length index  (max length + 2) x uint64: index of the first word of each length
+#   offsets       (word count + 1) x uint64: start of each word in the blob
+#   blob          the words (utf-8), sorted by length, no separator
+
+import mmap
+import os
+import struct
+import sys
+from array import array
+from wordlist import iter_words
+
+MAGIC = b"HMC1"
+HEADER = struct.Struct("<4sIQqQQ")
+EXTENSION = ".hmc"
+
+def cache_path(source):
+    return source + EXTENSION
+
+def source_key(source):
+    st = os.stat(source)
+    return st.st_size, st.st_mtime_ns
+
+def write_cache(path, words, key):
+    """Write the compiled corpus for words (already valid and lowercase)."""
+    words = sorted(words, key=len)
+    max_len = len(words[-1]) if words else 0
+    length_starts = array("Q", [0] * (max_len + 2))
+    offsets = array("Q", [0])
+    blob = bytearray()
+    for w in words:
+        blob += w.encode("utf-8")
+        offsets.append(len(blob))
+    # first word of each length (words are sorted by length)
+    n = 0
+    for length in range(max_len + 2):
+        while n < len(words) and len(words[n]) < length:
+            n += 1
+        length_starts[length] = n
+    blob += b"\0" * (-len(blob) % 8)
+    tmp = path + ".tmp"
+    try:
+        with open(tmp, "wb") as f:
+            f.write(HEADER.pack(MAGIC, max_len, key[0], key[1], len(words), len(blob)))
+            f.write(length_starts.tobytes())
+            f.write(offsets.tobytes())
+            f.write(blob)
+        os.replace(tmp, path)
+    except BaseException:
+        # interrupted (disk full, Ctrl-C...): no half written file left behind
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+
+class Corpus:
+    """Read-only list of words backed by a memory-mapped compiled file."""
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            self.mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.view = None
+        self.length_starts = self.offsets = None
+        try:
+            magic, self.max_len, size, mtime, self.count, blob_size = HEADER.unpack_from(self.mm, 0)
+            if magic != MAGIC:
+                raise ValueError(f"{path}: not a compiled word list")
+        except (ValueError, struct.error):
+            self.close()
+            raise
+        self.key = (size, mtime)
+        view = self.view = memoryview(self.mm)
+        pos = HEADER.size
+        self.length_starts = view[pos:pos + (self.max_len + 2) * 8].cast("Q")
+        pos += (self.max_len + 2) * 8
+        self.offsets = view[pos:pos + (self.count + 1) * 8].cast("Q")
+        pos += (self.count + 1) * 8
+        self.blob_start = pos
+
+    def close(self):
+        """Unmap the file (needed before replacing it on Windows)."""
+        for v in (self.length_starts, self.offsets, self.view):
+            if v is not None:
+                v.release()
+        self.length_starts = self.offsets = self.view = None
+        self.mm.close()
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += self.count
+        if not 0 <= i < self.count:
+            raise IndexError(i)
+        start = self.blob_start + self.offsets[i]
+        end = self.blob_start + self.offsets[i + 1]
+        return self.mm[start:end].decode("utf-8")
+
+    def __iter__(self):
+        for i in range(self.count):
+            yield self[i]
+
+    def length_ranges(self):
+        """length -> range of the indices of the words of that length."""
+        ranges = {}
+        for length in range(self.max_len + 1):
+            start, end = self.length_starts[length], self.length_starts[length + 1]
+            if end > start:
+                ranges[length] = range(start, end)
+        return ranges
+
+def load_corpus(source, cache=None, words=None):
+    """Compiled corpus of the text file source, built only if the cache is missing or stale.
+    words: function returning the words to compile (default: valid lines of source).
+    If the cache cannot be written (read-only folder), it is built in a temporary file."""
+    cache = cache if cache is not None else cache_path(source)
+    key = source_key(source)
+    try:
+        corpus = Corpus(cache)
+        if corpus.key == key:
+            return corpus
+        # stale: unmapped before it is replaced
+        corpus.close()
+    except (OSError, ValueError, struct.error):
+        pass
+    words = list(words() if words is not None else iter_words(source))
+    try:
+        write_cache(cache, words, key)
+    except OSError:
+        import tempfile
+        fd, cache = tempfile.mkstemp(suffix=EXTENSION)
+        os.close(fd)
+        write_cache(cache, words, key)
+    return Corpus(cache)
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python3 corpus_cache.py <wordlist.txt> [...]")
+        sys.exit(1)
+    for source in sys.argv[1:]:
+        corpus = load_corpus(source)
+        print(f"{corpus.path}: {len(corpus)} words")
@@ -0,0 +1,237 @@
+# difficulty_index.py
+# Difficulty of each word measured on the word list itself, instead of its length:
+#   rarity     how rare its letters are (mean -log2 of the share of words containing each letter)
+#   distinct   number of distinct letters (fewer letters = fewer chances to hit one)
+#   neighbors  words of the same length differing by one letter ("bat", "cat", "hat", ...)
+#   length     number of letters
+# The weights of the features are fitted on the word list: every word is played
+# by the frequency player of tournament.py (letters in English frequency order,
+# hangman_engine.py rules) and the score is the penalty predicted by a least
+# squares fit of the features to the penalties of these games. A word list where
+# the buckets do not come out in order (win rate easy > medium > hard) is not
+# used: apply_index() keeps the length rules.
+# The words are split in thirds by score (easy / medium / hard) and the buckets are
+# saved in a sidecar file (words.txt.hmc -> words.txt.hmc.hdi), so the game only
+# calls WordPool.set_bucket() at startup, nothing is scanned.
+# The features are computed per word length, in parallel, and kept in the sidecar:
+# when the word list changes only the lengths whose words changed are computed again.
+# Usage (offline build):
+#   python3 difficulty_index.py words.txt [--workers N]
+
+import argparse
+import hashlib
+import json
+import math
+import os
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from hangman_engine import MAX_PENALTY, LETTER_PENALTY
+
+VERSION = 2
+EXTENSION = ".hdi"
+LEVELS = ("easy", "medium", "hard")
+# score = bias + sum of weight * feature (predicted penalty, higher is harder)
+FEATURES = ("rarity", "neighbors", "distinct", "length")
+ENGLISH_ORDER = "etaoinshrdlcumwfgypbvkjxqz"
+
+def index_path(words):
+    """Sidecar of a compiled corpus (see corpus_cache.py), None for a plain list."""
+    path = getattr(words, "path", None)
+    return path + EXTENSION if path else None
+
+def words_key(words):
+    """Identifies the word list cheaply: source key of a compiled corpus, else None."""
+    key = getattr(words, "key", None)
+    return [*key, len(words)] if key else None
+
+def letter_mask(word):
+    mask = 0
+    for c in word:
+        mask |= 1 << (ord(c) - 97)
+    return mask
+
+def frequency_penalty(mask):
+    """Penalty of the frequency player of tournament.py on a word with these letters
+    (MAX_PENALTY or more: lost)."""
+    penalty = 0
+    for letter in ENGLISH_ORDER:
+        if not mask:
+            break
+        bit = 1 << (ord(letter) - 97)
+        if mask & bit:
+            mask &= ~bit
+        else:
+            penalty += LETTER_PENALTY
+            if penalty >= MAX_PENALTY:
+                break
+    return penalty
+
+def fit(rows, targets):
+    """Least squares weights of rows (lists of features, the first one 1.0) for targets."""
+    n = len(rows[0])
+    a = [[0.0] * (n + 1) for _ in range(n)]
+    for row, y in zip(rows, targets):
+        for i in range(n):
+            ai = a[i]
+            for j in range(n):
+                ai[j] += row[i] * row[j]
+            ai[n] += row[i] * y
+    for i in range(n):
+        a[i][i] += 1e-9  # a feature that never changes (one word length only)
+    # Gauss-Jordan elimination with partial pivoting
+    for col in range(n):
+        pivot = max(range(col, n), key=lambda r: abs(a[r][col]))
+        a[col], a[pivot] = a[pivot], a[col]
+        p = a[col][col]
+        for r in range(n):
+            if r != col and a[r][col]:
+                f = a[r][col] / p
+                a[r] = [x - f * y for x, y in zip(a[r], a[col])]
+    return [a[i][n] / a[i][i] for i in range(n)]
+
+def is_ordered(index):
+    """True when the buckets rank the words as expected: win rate easy > medium > hard."""
+    rates = [index["win_rates"][name] for name in LEVELS]
+    return all(a > b for a, b in zip(rates, rates[1:]))
+
+def group_hash(words, indices):
+    h = hashlib.sha1()
+    for i in indices:
+        h.update(words[i].encode("utf-8"))
+        h.update(b"\n")
+    return h.hexdigest()
+
+def group_features(task):
+    """Features of the words of one length: (length, letter masks, neighbor counts,
+    penalties of the frequency player)."""
+    length, group = task
+    counts = Counter()
+    for w in group:
+        for i in range(length):
+            counts[w[:i] + "_" + w[i + 1:]] += 1
+    neighbors = [sum(counts[w[:i] + "_" + w[i + 1:]] - 1 for i in range(length)) for w in group]
+    masks = [letter_mask(w) for w in group]
+    return length, masks, neighbors, [frequency_penalty(m) for m in masks]
+
+def build_index(pool, old=None, workers=None):
+    """Index of the words of pool (a WordPool), reusing the lengths of old that did not change."""
+    words = pool.words
+    old_groups = old["groups"] if old else {}
+    groups = {}
+    todo = []
+    for length, indices in pool.by_length.items():
+        h = group_hash(words, indices)
+        previous = old_groups.get(str(length))
+        if previous is not None and previous["hash"] == h:
+            groups[str(length)] = previous
+        else:
+            groups[str(length)] = {"hash": h}
+            todo.append((length, [words[i] for i in indices]))
+    if len(todo) > 1 and workers != 1:
+        with ProcessPoolExecutor(workers) as executor:
+            results = list(executor.map(group_features, todo))
+    else:
+        results = [group_features(task) for task in todo]
+    for length, masks, neighbors, penalties in results:
+        groups[str(length)].update(masks=masks, neighbors=neighbors, penalties=penalties)
+
+    # share of the words containing each letter
+    containing = [0] * 26
+    for g in groups.values():
+        for mask in g["masks"]:
+            for c in range(26):
+                if mask >> c & 1:
+                    containing[c] += 1
+    total = max(1, len(words))
+    rarity = [-math.log2(n / total) if n else 0.0 for n in containing]
+
+    # one row of features per word: 1 (bias), rarity, neighbors, distinct, length
+    rows = []
+    targets = []
+    ids = []
+    for length, indices in pool.by_length.items():
+        g = groups[str(length)]
+        for i, mask, neighbors, penalty in zip(indices, g["masks"], g["neighbors"], g["penalties"]):
+            letters = [c for c in range(26) if mask >> c & 1]
+            rows.append([1.0, sum(rarity[c] for c in letters) / len(letters),
+                         math.log2(1 + neighbors), float(len(letters)), float(length)])
+            targets.append(min(penalty, MAX_PENALTY))
+            ids.append(i)
+    if not rows:
+        return {"version": VERSION, "key": words_key(words), "weights": {}, "groups": groups,
+                "buckets": {name: [] for name in LEVELS}, "win_rates": {name: 0.0 for name in LEVELS}}
+    w = fit(rows, targets)
+    weights = dict(zip(("bias",) + FEATURES, w))
+    ranked = sorted(range(len(rows)), key=lambda k: sum(x * y for x, y in zip(w, rows[k])))
+    third = len(ranked) / len(LEVELS)
+    buckets = {}
+    win_rates = {}
+    for k, name in enumerate(LEVELS):
+        part = ranked[round(k * third):round((k + 1) * third)]
+        buckets[name] = sorted(ids[r] for r in part)
+        win_rates[name] = sum(targets[r] < MAX_PENALTY for r in part) / max(1, len(part))
+    return {"version": VERSION, "key": words_key(words), "weights": weights,
+            "groups": groups, "buckets": buckets, "win_rates": win_rates}
+
+def load_index(path):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if index.get("version") != VERSION:
+        return None
+    return index
+
+def save_index(path, index):
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(index, f, separators=(",", ":"))
+    os.replace(tmp, path)
+
+def difficulty_index(pool, path=None, workers=None):
+    """Index of pool, read from the sidecar when it is up to date, else (re)built and saved."""
+    path = path if path is not None else index_path(pool.words)
+    old = load_index(path) if path else None
+    key = words_key(pool.words)
+    if old is not None and key is not None and old["key"] == key:
+        return old
+    index = build_index(pool, old, workers)
+    if path:
+        try:
+            save_index(path, index)
+        except OSError:
+            pass  # read-only folder: the index is used without being saved
+    return index
+
+def apply_index(pool, index):
+    """Replace the length rules of pool by the measured difficulties.
+    Returns False (pool unchanged) when the buckets are not in order (see is_ordered)."""
+    if not is_ordered(index):
+        return False
+    for name, indices in index["buckets"].items():
+        pool.set_bucket(name, indices)
+    return True
+
+def main():
+    from corpus_cache import load_corpus
+    from word_pool import WordPool
+
+    parser = argparse.ArgumentParser(description="Build the difficulty index of word lists")
+    parser.add_argument("words", nargs="+", help="word list files")
+    parser.add_argument("--workers", type=int, default=None, help="processes (default: one per core)")
+    args = parser.parse_args()
+    for source in args.words:
+        start = time.perf_counter()
+        pool = WordPool(load_corpus(source))
+        index = difficulty_index(pool, workers=args.workers)
+        sizes = ", ".join(f"{name} {len(index['buckets'][name])} ({index['win_rates'][name]:.0%} won)"
+                          for name in LEVELS)
+        print(f"{index_path(pool.words)}: {len(pool)} words ({sizes}) "
+              f"in {(time.perf_counter() - start) * 1000:.0f} ms")
+        if not is_ordered(index):
+            print("  buckets not in order of difficulty: the length rules are kept")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+# frame_profiler.py
+# Where does the frame time go? Times each phase of the frame (events, draw, flip, ...)
+# and some functions (draw_hangman, get_best_score, ...) with perf_counter_ns.
+# The last WINDOW frames are kept in ring buffers (rolling p50 / p95 / FPS),
+# every frame can also be written to a CSV or JSON trace for offline analysis.
+# Off by default: hangman_pygame.py does not create a profiler at all, so it costs nothing.
+# Enable with:
+#   HANGMAN_PROFILE=1 python3 hangman_pygame.py                        # F3 toggles the overlay
+#   HANGMAN_PROFILE=1 HANGMAN_PROFILE_TRACE=frames.csv python3 hangman_pygame.py
+# A summary is printed to stderr at exit.
+
+import json
+import os
+import sys
+import time
+from array import array
+from functools import wraps
+
+ENABLED = os.environ.get("HANGMAN_PROFILE") == "1"
+TRACE = os.environ.get("HANGMAN_PROFILE_TRACE")  # .csv or .json
+WINDOW = 300  # frames kept for the rolling statistics (10 s at 30 FPS)
+
+class FrameProfiler:
+    def __init__(self, phases, functions=(), window=WINDOW, trace=None):
+        # "work" = sum of the phases, "period" = time between two frame starts (-> FPS)
+        self.phases = list(phases)
+        self.functions = list(functions)
+        self.names = self.phases + self.functions + ["work", "period"]
+        self.window = window
+        self.samples = {name: array("q", bytes(8 * window)) for name in self.names}
+        self.current = dict.fromkeys(self.phases + self.functions, 0)
+        self.frames = 0
+        self.frame_start = None
+        self.last = None
+        self.overlay = False
+        self.trace = None
+        self.trace_json = False
+        if trace:
+            self.open_trace(trace)
+
+    # ---------- recording ----------
+    def begin_frame(self):
+        now = time.perf_counter_ns()
+        if self.frame_start is not None:
+            self.current_period = now - self.frame_start
+        else:
+            self.current_period = 0
+        self.frame_start = self.last = now
+        for name in self.current:
+            self.current[name] = 0
+
+    def mark(self, phase):
+        """End of a phase: the time since the previous mark is added to it."""
+        now = time.perf_counter_ns()
+        self.current[phase] += now - self.last
+        self.last = now
+
+    def timed(self, name, fn):
+        """fn wrapped to add its (inclusive) time to the column name."""
+        current = self.current
+        clock = time.perf_counter_ns
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            t = clock()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                current[name] += clock() - t
+        return wrapper
+
+    def end_frame(self, idle=()):
+        """Store the frame. idle: phases not counted in the work time (e.g. clock.tick)."""
+        work = sum(v for name, v in self.current.items() if name in self.phases and name not in idle)
+        i = self.frames % self.window
+        for name, value in self.current.items():
+            self.samples[name][i] = value
+        self.samples["work"][i] = work
+        self.samples["period"][i] = self.current_period
+        if self.trace:
+            self.write_row(work)
+        self.frames += 1
+
+    # ---------- statistics ----------
+    def values(self, name):
+        count = min(self.frames, self.window)
+        return sorted(self.samples[name][:count])
+
+    def percentile(self, name, p):
+        values = self.values(name)
+        if not values:
+            return 0
+        return values[min(len(values) - 1, int(len(values) * p / 100))]
+
+    def fps(self):
+        periods = [v for v in self.samples["period"][:min(self.frames, self.window)] if v]
+        return 1e9 * len(periods) / sum(periods) if periods else 0.0
+
+    def overlay_lines(self):
+        lines = [f"FPS {self.fps():5.1f}   frame p95 {self.percentile('work', 95) / 1e6:6.2f} ms"]
+        for name in self.phases + self.functions:
+            lines.append(f"{name:14s} p95 {self.percentile(name, 95) / 1e6:6.2f} ms")
+        return lines
+
+    def report(self, file=None):
+        file = file if file is not None else sys.stderr
+        print(f"frames: {self.frames}, last {min(self.frames, self.window)}: {self.fps():.1f} FPS", file=file)
+        print(f"{'phase':16s} {'mean':>8s} {'p50':>8s} {'p95':>8s} {'max':>8s}  (ms)", file=file)
+        for name in self.names:
+            values = self.values(name)
+            if not values:
+                continue
+            mean = sum(values) / len(values)
+            print(f"{name:16s} {mean / 1e6:8.3f} {self.percentile(name, 50) / 1e6:8.3f} "
+                  f"{self.percentile(name, 95) / 1e6:8.3f} {values[-1] / 1e6:8.3f}", file=file)
+
+    # ---------- trace ----------
+    def open_trace(self, path):
+        self.trace = open(path, "w", encoding="utf-8", buffering=1 << 16)
+        self.trace_json = path.endswith(".json")
+        columns = ["frame", "start_ns"] + self.phases + self.functions + ["work", "period"]
+        if self.trace_json:
+            self.trace.write("[\n")
+        else:
+            self.trace.write(",".join(columns) + "\n")
+
+    def write_row(self, work):
+        row = [self.frames, self.frame_start, *self.current.values(), work, self.current_period]
+        if self.trace_json:
+            columns = ["frame", "start_ns", *self.current, "work", "period"]
+            if self.frames:
+                self.trace.write(",\n")
+            self.trace.write(json.dumps(dict(zip(columns, row))))
+        else:
+            self.trace.write(",".join(map(str, row)) + "\n")
+
+    def close(self):
+        if self.trace:
+            if self.trace_json:
+                self.trace.write("\n]\n")
+            self.trace.close()
+            self.trace = None
+        self.report()
@@ -0,0 +1,55 @@
+# frame_scheduler.py
+# Frame pacing shared by the pygame frontends (hangman_pygame.py, ../Day8/hangman/main.py).
+# Instead of drawing FPS frames per second forever, the loop sleeps in
+# pygame.event.wait() until something happens:
+#   - an event (key, click, window exposed, ...)
+#   - the timeout given by the caller (e.g. the next second of the countdown)
+#   - or, for a short time after an event or after animate(), the next frame at full FPS
+# An idle window then uses (almost) no CPU.
+
+import time
+import pygame
+
+LINGER = 0.5  # seconds at full FPS after an event (key repeat, feedback, ...)
+
+class FrameScheduler:
+    def __init__(self, fps=30, linger=LINGER):
+        self.fps = fps
+        self.linger = linger
+        self.clock = pygame.time.Clock()
+        self.animate_until = 0.0
+
+    def animate(self, seconds):
+        """Draw at full FPS for the next `seconds` (transitions, animations)."""
+        self.animate_until = max(self.animate_until, time.monotonic() + seconds)
+
+    @property
+    def animating(self):
+        return time.monotonic() < self.animate_until
+
+    def wait(self, timeout=None):
+        """Wait for the next frame, returns the events to handle (maybe none).
+        timeout: seconds before the caller needs a frame anyway, None = only on events."""
+        if self.animating:
+            self.clock.tick(self.fps)
+            events = pygame.event.get()
+        else:
+            if timeout is None:
+                ev = pygame.event.wait()
+            else:
+                ev = pygame.event.wait(max(1, int(timeout * 1000)))
+            if ev.type == pygame.NOEVENT:
+                return []
+            events = [ev] + pygame.event.get()
+            # restart the tick clock, so the first animated frame does not wait
+            self.clock.tick()
+        if events and self.linger:
+            self.animate(self.linger)
+        return events
+
+def next_second(seconds_left):
+    """Timeout until a countdown showing int(seconds_left) changes (None if there is no countdown)."""
+    if seconds_left is None:
+        return None
+    # a little after the change, so int() already shows the new value
+    return seconds_left % 1 + 0.005 if seconds_left > 0 else 0
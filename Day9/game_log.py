@@ -0,0 +1,159 @@
+# game_log.py
+# Append-only binary log of every game event (start, guess, hint, win, loss).
+# Records are small and length-prefixed, writes go through a large buffer and
+# the log is split in segments of at most SEGMENT_SIZE bytes
+# (game-000001-<pid>.hlog, game-000002-<pid>.hlog, ...), so log_analytics.py can read
+# the segments in parallel. Every record is self-contained (the end of a game
+# repeats the word), a segment can be analysed without the others.
+# Each process writes its own segments (new segment at startup, pid in the name):
+# several frontends / servers can share one log directory, their buffered writes
+# never mix in the same file.
+# Opt-in: HANGMAN_EVENT_LOG=<directory> python3 hangman_pygame.py
+#
+# Record layout (little-endian):
+#   uint16  size of what follows
+#   uint8   type (START, GUESS, HINT, WIN, LOSS)
+#   uint32  game id (counts from 1 in each process: with the pid of the segment
+#           name it identifies a game in the log directory)
+#   ...     START: word | GUESS: uint8 result, text | HINT: letter
+#           WIN / LOSS: uint16 attempts, uint8 penalty, word
+# Text is utf-8, without terminator (it ends with the record), at most MAX_TEXT bytes.
+
+import atexit
+import os
+import struct
+from hangman_engine import INVALID, ALREADY, FOUND, MISSED, OVER
+
+SEGMENT_SIZE = 64 * 1024 * 1024
+BUFFER_SIZE = 64 * 1024
+SEGMENT_PREFIX = "game-"
+SEGMENT_SUFFIX = ".hlog"
+
+START, GUESS, HINT, WIN, LOSS = range(5)
+TYPE_NAMES = ["start", "guess", "hint", "win", "loss"]
+RESULTS = [INVALID, ALREADY, FOUND, MISSED, OVER]
+RESULT_CODES = {r: i for i, r in enumerate(RESULTS)}
+
+PREFIX = struct.Struct("<HBI")   # size, type, game id
+END = struct.Struct("<HB")       # attempts, penalty
+# longest text kept in a record (a guess sent by a server client can be anything),
+# the rest is cut so that the record size fits in its uint16
+MAX_TEXT = 1024
+
+def encode_text(text):
+    """utf-8 bytes of text, cut to MAX_TEXT bytes (on a character boundary)."""
+    data = text.encode("utf-8")
+    if len(data) > MAX_TEXT:
+        data = data[:MAX_TEXT].decode("utf-8", "ignore").encode("utf-8")
+    return data
+
+def segment_name(number, pid):
+    return f"{SEGMENT_PREFIX}{number:06d}-{pid}{SEGMENT_SUFFIX}"
+
+def segment_number(path):
+    """Number of a segment file name (game-000012-4242.hlog -> 12)."""
+    name = os.path.basename(path)[len(SEGMENT_PREFIX):-len(SEGMENT_SUFFIX)]
+    return int(name.split("-")[0])
+
+def list_segments(directory):
+    """Segment files of a log directory, oldest first."""
+    try:
+        names = os.listdir(directory)
+    except FileNotFoundError:
+        return []
+    return [os.path.join(directory, n) for n in sorted(names)
+            if n.startswith(SEGMENT_PREFIX) and n.endswith(SEGMENT_SUFFIX)]
+
+class GameLog:
+    def __init__(self, directory, segment_size=SEGMENT_SIZE, buffer_size=BUFFER_SIZE):
+        self.directory = directory
+        self.segment_size = segment_size
+        self.buffer_size = buffer_size
+        os.makedirs(directory, exist_ok=True)
+        self.segment = 0
+        self._file = None     # segment opened on the first record (no empty file per run)
+        self._size = 0
+        # ids of this process only: nothing to read from the existing segments
+        self._next_id = 1
+        atexit.register(self.close)
+
+    def _open(self):
+        # a new segment, never one of another process: only the names are read
+        self.pid = os.getpid()
+        segments = list_segments(self.directory)
+        number = max(self.segment, segment_number(segments[-1]) if segments else 0)
+        while True:
+            number += 1
+            path = os.path.join(self.directory, segment_name(number, self.pid))
+            try:
+                self._file = open(path, "xb", buffering=self.buffer_size)
+                break
+            except FileExistsError:
+                continue
+        self.segment = number
+        self._size = 0
+
+    def _write(self, kind, game_id, body):
+        record = PREFIX.pack(len(body) + 5, kind, game_id) + body
+        if self._file is None:
+            self._open()
+        elif self._size + len(record) > self.segment_size and self._size:
+            self._file.close()
+            self._open()
+        self._file.write(record)
+        self._size += len(record)
+
+    # ---------- events ----------
+    def start(self, word):
+        """New game, returns its id."""
+        game_id = self._next_id
+        self._next_id += 1
+        self._write(START, game_id, encode_text(word))
+        return game_id
+
+    def guess(self, game_id, text, result):
+        self._write(GUESS, game_id, bytes((RESULT_CODES[result],)) + encode_text(text))
+
+    def hint(self, game_id, letter):
+        self._write(HINT, game_id, encode_text(letter))
+
+    def end(self, game_id, won, attempts, penalty, word):
+        body = END.pack(min(attempts, 0xffff), min(penalty, 0xff)) + encode_text(word)
+        self._write(WIN if won else LOSS, game_id, body)
+
+    def flush(self):
+        if self._file:
+            self._file.flush()
+
+    def close(self):
+        if self._file:
+            self._file.close()
+            self._file = None
+
+def iter_records(path, start=0, chunk_size=1 << 20):
+    """(type, game id, body) of the records of a segment, read chunk by chunk.
+    A record cut at the end of the file (crash during a write) is ignored."""
+    with open(path, "rb") as f:
+        f.seek(start)
+        data = b""
+        pos = 0
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                return
+            # the end of the previous chunk (a cut record) + the new chunk
+            data = data[pos:] + chunk
+            pos = 0
+            end = len(data)
+            while end - pos >= 2:
+                size, = struct.unpack_from("<H", data, pos)
+                if end - pos < size + 2:
+                    break
+                kind, game_id = struct.unpack_from("<BI", data, pos + 2)
+                yield kind, game_id, data[pos + 7:pos + 2 + size]
+                pos += 2 + size
+
+def from_env():
+    """GameLog of HANGMAN_EVENT_LOG, or None when it is not set."""
+    directory = os.environ.get("HANGMAN_EVENT_LOG")
+    return GameLog(directory) if directory else None
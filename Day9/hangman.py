@@ -1,7 +1,9 @@
-import random
 import sys
 import os
-from datetime import datetime
+from score_store import ScoreStore
+from wordlist import random_word, LineIndex
+from hangman_engine import HangmanGame, INVALID, ALREADY, FOUND
+import game_log
 
 BEST_FILE = "best_scores"
 
@@ -21,117 +23,108 @@ def my_word():
         print(f"Error: file '{script}' not found")
         sys.exit(1)
 
-    # Lire les mots depuis le fichier
-    with open(script, "r") as f:
-        words = [line.strip() for line in f if line.strip().isalpha()]
+    # Choisir un mot au hasard, sans lire tout le fichier (voir wordlist.py)
+    chosen_word = random_word(script)
 
-    if not words:
+    if not chosen_word:
         print("Error: no valid words in the file")
         sys.exit(1)
 
-    # Choisir un mot au hasard
-    chosen_word = random.choice(words)
-    return chosen_word.lower()
+    return chosen_word
+
+# best scores: same store as hangman_pygame.py (see score_store.py)
+scores = ScoreStore(BEST_FILE)
+# HANGMAN_EVENT_LOG=<directory>: every guess / hint / end of game is logged (see game_log.py)
+event_log = game_log.from_env()
 
 def get_best_score():
-    if not os.path.exists(BEST_FILE):
-        return None
-    with open(BEST_FILE, "r") as f:
-        lines = f.readlines()
-        if not lines:
-            return None
-        # Récupérer le dernier score enregistré
-        last_line = lines[-1].strip()
-        try:
-            parts = last_line.split("attempts: ")
-            return int(parts[1])
-        except:
-            return None
-
-def save_best_score(word, attempts):
-    date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    with open(BEST_FILE, "a") as f:
-        f.write(f"{date} - word: {word} - attempts: {attempts}\n")
+    return scores.best()
 
 def end_game(word, attempts):
     best = get_best_score()
-    if best is None or attempts < best:
-                        save_best_score(word, attempts)
+    if scores.add_win(word, attempts):
                         print(f"Best ever!!! You've guessed \"{word}\" in {attempts} attempts.")
     else:
           print(f"You've guessed \"{word}\" in {attempts} attempts. The record is {best} attempts.")
 
+def penalties(penalty):
+    return "penalty" if penalty <= 1 else "penalties"
+
 def game():
     chosen_word = my_word()
-    hidden_word = ["_"] * len(chosen_word)
+    # les règles sont dans hangman_engine.py (mêmes règles que la version pygame)
+    g = HangmanGame(secret=chosen_word, log=event_log)
 
-    penalty = 0
-    max_penalty = 12
-    attempts = 0
-
-    print("You must guess the word:", " ".join(hidden_word))
+    print("You must guess the word:", g.display())
 
 
     # Boucle principale
-    while penalty <= max_penalty:
+    while not g.finished:
         input_chosen_word = input("Enter a letter or a word: ").strip().lower()
-        attempts += 1
 
-        if not input_chosen_word.isalpha():
-            print(" Just enter letters.")
-            continue
     # Mot trop long
         if len(input_chosen_word) > len(chosen_word) and len(input_chosen_word) > 1:
                 print("Input too long! try again")
                 continue
-                    # Cas mot complet
+
+        result = g.guess(input_chosen_word)
+        if result == INVALID:
+            print(" Just enter letters.")
+            continue
+        if result == ALREADY:
+            print(f" You already tried '{input_chosen_word}'")
+            continue
+
+        # Cas mot complet
         if len(input_chosen_word) > 1:
-            if input_chosen_word == chosen_word:
-                print(f"{chosen_word} : correct guess - {penalty} penalties")
-                end_game(chosen_word, attempts)
-                return
+            if result == FOUND:
+                print(f"{chosen_word} : correct guess - {g.penalty} {penalties(g.penalty)}")
             else:
-                penalty += 5
                 print(f"{input_chosen_word}: incorrect guess")
-
-                print(f"{" ".join(hidden_word)} /{penalty} penalties")
+                print(f"{g.display()} /{g.penalty} {penalties(g.penalty)}")
 
         # Cas lettre
         else:
-            if input_chosen_word in chosen_word:
-                #print(f" found one '{input_chosen_word}'")
-                for i, letter in enumerate(chosen_word):
-                    if letter == input_chosen_word:
-                        hidden_word[i] = input_chosen_word
-                        print(f"found one '{input_chosen_word}'")
-                        if penalty <= 1:
-                            print(f"{" ".join(hidden_word)} /{penalty} penalty")
-                        else:
-                            print(f"{" ".join(hidden_word)} /{penalty} penalties")
+            if result == FOUND:
+                print(f"found one '{input_chosen_word}'")
             else:
-                penalty += 1
-
                 print(f" No '{input_chosen_word}' found")
+            # Afficher l'état actuel du mot
+            print(f"{g.display()} /{g.penalty} {penalties(g.penalty)}")
 
-        # Afficher l'état actuel du mot
-                if penalty <= 1:
-                    print(f"{" ".join(hidden_word)} /{penalty} penalty")
-                else:
-                    print(f"{" ".join(hidden_word)} /{penalty} penalties")
-                        # Vérifier si le mot est complètement trouvé
-        if "".join(hidden_word) == chosen_word:
-            print(f"You win! The word was '{chosen_word}'.")
-            end_game(chosen_word, attempts)
-            return
-
-    # Si trop de pénalités
-    print(f"Game over! Too many penalties. The word was '{chosen_word}'.")
-    # Pas de score enregistré si on perd
+    if g.won:
+        print(f"You win! The word was '{chosen_word}'.")
+        end_game(chosen_word, g.attempts)
+    else:
+        # Si trop de pénalités
+        print(f"Game over! Too many penalties. The word was '{chosen_word}'.")
+        # Pas de score enregistré si on perd
+
+def batch_mode():
+    # python3 hangman.py [words.txt] --batch scenarios.txt (voir batch.py)
+    import batch
+    i = sys.argv.index("--batch")
+    words = sys.argv[1:i]
+    pick_word = None
+    if words:
+        if not os.path.exists(words[0]):
+            print(f"Error: file '{words[0]}' not found")
+            sys.exit(1)
+        # fichier lu une seule fois, au premier "?" seulement, puis un mot au hasard pour chaque "?"
+        index = []
+        def pick_word():
+            if not index:
+                index.append(LineIndex(words[0]))
+            return index[0].choice()
+    batch.main(sys.argv[i + 1:], pick_word, skip_too_long=True, log=event_log)
 
 # Lancer le jeu
-while True:
-    game()
-    again = input("Do you want to play again? (y/n): ").lower()
-    if again != "y":
-        print("Thanks for playing!")
-        break
+if "--batch" in sys.argv:
+    batch_mode()
+else:
+    while True:
+        game()
+        again = input("Do you want to play again? (y/n): ").lower()
+        if again != "y":
+            print("Thanks for playing!")
+            break
@@ -0,0 +1,180 @@
+# hangman_engine.py
+# Hangman rules without pygame and without input(): hangman_pygame.py,
+# hangman.py and ../Day7/Mygame.py all play through this class.
+# The clock and the random generator can be injected, so games can be
+# simulated very fast (see benchmark.py) and replayed with a seed.
+
+import random
+import time
+from word_pool import WordPool
+
+MAX_PENALTY = 12
+LETTER_PENALTY = 1
+WORD_PENALTY = 5
+# Hints / AI cost in attempts (you can tune)
+HINT_PENALTY = 2
+
+# results of HangmanGame.guess()
+INVALID = "invalid"     # not only letters, nothing counted
+ALREADY = "already"     # letter already tried, nothing counted
+FOUND = "found"         # letter in the word (or the right word)
+MISSED = "missed"       # letter not in the word (or wrong word)
+OVER = "over"           # round already finished
+
+class HangmanGame:
+    def __init__(self, words=None, difficulty="medium", time_limit=None, secret=None, clock=time.monotonic, rng=None, log=None):
+        # words can be a plain list or a WordPool built once at load time,
+        # or None when the secret is always given to reset_round()
+        self.rng = rng if rng is not None else random.Random()
+        if words is None or isinstance(words, WordPool):
+            self.pool = words
+        else:
+            self.pool = WordPool(words, rng=self.rng)
+        self.difficulty = difficulty
+        self.time_limit = time_limit  # seconds or None
+        self.clock = clock            # function returning seconds
+        self.max_penalty = MAX_PENALTY
+        self.log = log                # game_log.GameLog or None: every event is recorded
+        self.game_id = None
+        self.reset_round(secret)
+
+    def reset_round(self, secret=None):
+        # choose word according to difficulty (precomputed buckets, no repeat in a session)
+        if secret is None:
+            secret = self.pool.draw(self.difficulty)
+        self.secret = secret.lower()
+        # letter -> bitmask of its positions in the secret, computed once per round
+        positions = {}
+        for i,c in enumerate(self.secret):
+            positions[c] = positions.get(c, 0) | (1 << i)
+        self.positions = positions
+        self.revealed = 0                  # bitmask of the revealed positions
+        self.remaining = len(self.secret)  # positions still hidden, 0 = won
+        self._hidden = None
+        self._display = None
+        self.penalty = 0
+        self.attempts = 0
+        self.used_letters = set()
+        self.last_message = ""
+        self.start_time = self.clock()
+        self.finished = False
+        self.won = False
+        if self.log:
+            self.game_id = self.log.start(self.secret)
+
+    def guess(self, text):
+        if self.finished:
+            return OVER
+        text = text.lower().strip()
+        if not text or not text.isalpha():
+            self.last_message = "Please enter letters only."
+            if self.log:
+                self.log.guess(self.game_id, text, INVALID)
+            return INVALID
+        if len(text) > 1:
+            # word guess
+            self.attempts += 1
+            if text == self.secret:
+                self.reveal_all()
+                result = FOUND
+            else:
+                self.penalty += WORD_PENALTY
+                self.last_message = f"Wrong word! Penalties: {self.penalty}/{self.max_penalty}"
+                result = MISSED
+        else:
+            # single letter
+            letter = text
+            if letter in self.used_letters:
+                self.last_message = f"You already tried '{letter}'."
+                if self.log:
+                    self.log.guess(self.game_id, letter, ALREADY)
+                return ALREADY
+            self.used_letters.add(letter)
+            self.attempts += 1
+            # positions of the letter not revealed yet (a hint may have revealed it already)
+            if self.reveal(letter):
+                self.last_message = f"Found letter '{letter}'!"
+                result = FOUND
+            else:
+                self.penalty += LETTER_PENALTY
+                self.last_message = f"Wrong letter! Penalties: {self.penalty}/{self.max_penalty}"
+                result = MISSED
+        if self.log:
+            self.log.guess(self.game_id, text, result)
+        if self.remaining == 0:
+            self.finish(win=True)
+        elif self.penalty >= self.max_penalty:
+            self.finish(win=False)
+        return result
+
+    def hint(self, letter=None):
+        """Reveal one unseen letter (random one if not given), costs HINT_PENALTY attempts.
+        Returns the revealed letter, or None if there is nothing to reveal."""
+        if self.finished:
+            return None
+        if letter is None:
+            unrevealed = [c for i,c in enumerate(self.secret) if not self.revealed >> i & 1]
+            if not unrevealed:
+                return None
+            letter = self.rng.choice(unrevealed)
+        # apply as if the user guessed letter, but with the hint cost
+        self.used_letters.add(letter)
+        self.reveal(letter)
+        self.attempts += HINT_PENALTY
+        if self.log:
+            self.log.hint(self.game_id, letter)
+        self.last_message = f"Hint revealed '{letter}' (-{HINT_PENALTY} attempts)."
+        if self.remaining == 0:
+            self.finish(win=True)
+        return letter
+
+    def reveal(self, letter):
+        """Reveal every position of letter, returns the bitmask of the new positions (0 if none)."""
+        mask = self.positions.get(letter, 0) & ~self.revealed
+        if mask:
+            self.revealed |= mask
+            self.remaining -= mask.bit_count()
+            self._hidden = None
+            self._display = None
+        return mask
+
+    def reveal_all(self):
+        self.revealed = (1 << len(self.secret)) - 1
+        self.remaining = 0
+        self._hidden = None
+        self._display = None
+
+    @property
+    def hidden(self):
+        # list of letters / "_" built from the revealed mask, cached until it changes
+        # (read only: use reveal() to change it)
+        if self._hidden is None:
+            self._hidden = [c if self.revealed >> i & 1 else "_" for i,c in enumerate(self.secret)]
+        return self._hidden
+
+    def display(self):
+        if self._display is None:
+            self._display = " ".join(self.hidden)
+        return self._display
+
+    def finish(self, win):
+        # frontends override this to record scores
+        self.finished = True
+        self.won = win
+        if self.log:
+            self.log.end(self.game_id, win, self.attempts, self.penalty, self.secret)
+
+    def time_left(self):
+        if self.time_limit is None:
+            return None
+        elapsed = self.clock() - self.start_time
+        return max(0, self.time_limit - elapsed)
+
+def play(game, guesses):
+    """Play a sequence of guesses until the round is finished.
+    Returns the game (won / attempts / penalty are on it)."""
+    for text in guesses:
+        if game.finished:
+            break
+        game.guess(text)
+    return game
@@ -5,86 +5,165 @@
 # If no file provided, the program will try to use english_words package (if installed),
 # else will fall back to a built-in small list.
 
-import pygame
+import startup
 import sys
 import os
-import random
-from datetime import datetime
+import atexit
+from collections import OrderedDict
+with startup.phase("import pygame"):
+    import pygame
+from word_pool import WordPool, DEFAULT_WORDS
+from wordlist import load_words
+from corpus_cache import load_corpus, EXTENSION as CORPUS_EXTENSION
+from score_store import ScoreStore
+from hangman_engine import HangmanGame as EngineGame
+import frame_profiler
+import game_log
+from frame_scheduler import FrameScheduler, next_second
 
 # ---------- Configuration ----------
 WINDOW_SIZE = (1000, 600)
-FPS = 30
+FPS = 30  # frame rate during transitions (see frame_scheduler.py)
 BEST_FILE = "best_scores"
-DEFAULT_WORDS = ["python","hangman","computer","programming","challenge","apple","banana","developer","keyboard","mouse"]
 ALPHABET = "abcdefghijklmnopqrstuvwxyz"
-
-# Hints / AI cost in attempts (you can tune)
-HINT_PENALTY = 2
+TEXT_CACHE_SIZE = 256  # rendered text surfaces kept in memory (LRU)
+# opt-in dirty rectangle rendering (only changed regions are redrawn / sent to the display)
+# enable with: HANGMAN_DIRTY_RECTS=1 python3 hangman_pygame.py
+DIRTY_RECTS = os.environ.get("HANGMAN_DIRTY_RECTS") == "1"
+# opt-in difficulty measured on the word list instead of the word length (see difficulty_index.py)
+# enable with: HANGMAN_DIFFICULTY_INDEX=1 python3 hangman_pygame.py words.txt
+DIFFICULTY_INDEX = os.environ.get("HANGMAN_DIFFICULTY_INDEX") == "1"
 
 # ---------- Utilities ----------
 def load_wordlist_from_file(path):
     if not os.path.exists(path):
         raise FileNotFoundError(path)
-    with open(path, "r", encoding="utf-8") as f:
-        words = [line.strip() for line in f if line.strip().isalpha()]
-    return [w.lower() for w in words]
+    # one pass, each line stripped and checked once (see wordlist.py)
+    return load_words(path)
+
+def load_english_words():
+    # english_words package, filtered once and compiled in ~/.cache/hangman (see corpus_cache.py)
+    import importlib.util
+    spec = importlib.util.find_spec("english_words")
+    if spec is None or not spec.origin:
+        raise ImportError("english_words")
+    cache_dir = os.path.join(os.path.expanduser("~"), ".cache", "hangman")
+    os.makedirs(cache_dir, exist_ok=True)
+    def words():
+        from english_words import english_words_lower_set
+        return [w for w in english_words_lower_set if w.isalpha() and w.islower() and 3 <= len(w) <= 12]
+    return load_corpus(spec.origin, os.path.join(cache_dir, "english_words" + CORPUS_EXTENSION), words)
+
+def check_word_file():
+    # the word list is loaded after the menu: a missing or empty file is reported
+    # now, before the window opens (a file without valid words only when loading)
+    if len(sys.argv) == 2:
+        path = sys.argv[1]
+        if not os.path.exists(path):
+            print("Error reading word file:", FileNotFoundError(path))
+            sys.exit(1)
+        if os.path.isfile(path) and os.path.getsize(path) == 0:
+            print("Error reading word file: File contains no valid words")
+            sys.exit(1)
 
 def load_words_from_args_or_default():
     if len(sys.argv) == 2:
         try:
-            words = load_wordlist_from_file(sys.argv[1])
-            if not words:
+            if not os.path.exists(sys.argv[1]):
+                raise FileNotFoundError(sys.argv[1])
+            # compiled word list, rebuilt only when the file changed
+            words = load_corpus(sys.argv[1])
+            if not len(words):
                 raise ValueError("File contains no valid words")
             return words
         except Exception as e:
             print("Error reading word file:", e)
+            pygame.quit()
             sys.exit(1)
     else:
         # try english_words if available
         try:
-            from english_words import english_words_lower_set
-            words = [w for w in english_words_lower_set if w.isalpha() and w.islower() and 3 <= len(w) <= 12]
-            return list(words)
+            words = load_english_words()
+            if len(words):
+                return words
         except Exception:
-            return DEFAULT_WORDS
+            pass
+        return DEFAULT_WORDS
+
+# best scores: parsed once and cached (see score_store.py), shared with hangman.py
+scores = ScoreStore(BEST_FILE)
+# opt-in binary log of every game event: HANGMAN_EVENT_LOG=<directory> (see game_log.py)
+event_log = game_log.from_env()
 
 def get_best_score():
-    if not os.path.exists(BEST_FILE):
-        return None
-    with open(BEST_FILE, "r", encoding="utf-8") as f:
-        lines = [l.strip() for l in f if l.strip()]
-    if not lines:
-        return None
-    # parse attempts from last line or best line - we'll take minimal attempts in file
-    attempts = []
-    for line in lines:
-        if "attempts:" in line:
-            try:
-                n = int(line.split("attempts:")[-1].strip())
-                attempts.append(n)
-            except:
-                pass
-    return min(attempts) if attempts else None
-
-def save_best_score(word, attempts):
-    date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    with open(BEST_FILE, "a", encoding="utf-8") as f:
-        f.write(f"{date} - word: {word} - attempts: {attempts}\n")
+    return scores.best()
 
 # ---------- Pygame UI helpers ----------
-pygame.init()
-screen = pygame.display.set_mode(WINDOW_SIZE)
-pygame.display.set_caption("Pendu - Hangman")
-clock = pygame.time.Clock()
-
-# fonts
-FONT = pygame.font.SysFont("arial", 20)
-BIG = pygame.font.SysFont("arial", 34, bold=True)
-SMALL = pygame.font.SysFont("arial", 16)
+# display and fonts are created by init_display() when main() starts,
+# importing this module does not open a window
+screen = None
+FONT = None
+BIG = None
+SMALL = None
+
+def init_display():
+    global screen, FONT, BIG, SMALL
+    with startup.phase("pygame.init + window"):
+        pygame.init()
+        screen = pygame.display.set_mode(WINDOW_SIZE)
+        pygame.display.set_caption("Pendu - Hangman")
+    with startup.phase("fonts"):
+        FONT = pygame.font.SysFont("arial", 20)
+        BIG = pygame.font.SysFont("arial", 34, bold=True)
+        SMALL = pygame.font.SysFont("arial", 16)
+
+# smart hint solver (needs numpy), imported and built on the first hint
+smart_solver = []
+
+def get_solver(words):
+    if not smart_solver:
+        try:
+            with startup.phase("import numpy + solver"):
+                from solver import Solver
+                smart_solver.append(Solver(words.words))
+        except ImportError:
+            smart_solver.append(None)  # no numpy: H reveals a random letter
+    return smart_solver[0]
+
+# autocomplete of the typed word (see autocomplete.py), built with the word list
+# (startup phase "autocomplete") so that typing never waits for it
+completer = []
+
+def get_completer(words):
+    if not completer:
+        from autocomplete import Autocomplete
+        completer.append(Autocomplete(words.words))
+    return completer[0]
+
+def suggestions(game, typed_buffer):
+    """Words that complete typed_buffer and still fit the game (TAB takes the first one)."""
+    if not typed_buffer or game.finished:
+        return ()
+    return tuple(get_completer(game.pool).suggest(typed_buffer, game.hidden, game.used_letters))
+
+# rendered text cache: (text, font, color) -> surface, least recently used dropped first
+text_cache = OrderedDict()
+
+def render_text(text, font=None, color=(255,255,255)):
+    font = font or FONT
+    key = (text, font, color)
+    r = text_cache.get(key)
+    if r is None:
+        r = font.render(text, True, color)
+        text_cache[key] = r
+        if len(text_cache) > TEXT_CACHE_SIZE:
+            text_cache.popitem(last=False)
+    else:
+        text_cache.move_to_end(key)
+    return r
 
-def draw_text(surface, text, pos, font=FONT, color=(255,255,255)):
-    r = font.render(text, True, color)
-    surface.blit(r, pos)
+def draw_text(surface, text, pos, font=None, color=(255,255,255)):
+    return surface.blit(render_text(text, font, color), pos)
 
 # ---------- Game logic classes ----------
 class Button:
@@ -103,88 +182,16 @@ class Button:
             if self.rect.collidepoint(ev.pos) and self.cb:
                 self.cb()
 
-class HangmanGame:
+class HangmanGame(EngineGame):
+    """Rules are in hangman_engine.py, this adds the pygame clock and the best scores."""
     def __init__(self, words, difficulty="medium", time_limit=None):
-        self.words = words
-        self.difficulty = difficulty
-        self.time_limit = time_limit  # seconds or None
-        self.reset_round()
-
-    def reset_round(self):
-        # choose word according to difficulty
-        if self.difficulty == "easy":
-            pool = [w for w in self.words if len(w) <= 5]
-        elif self.difficulty == "hard":
-            pool = [w for w in self.words if len(w) >= 7]
-        else:
-            pool = self.words
-        if not pool:
-            pool = self.words
-        self.secret = random.choice(pool).lower()
-        self.hidden = ["_"] * len(self.secret)
-        self.penalty = 0
-        self.max_penalty = 12
-        self.attempts = 0
-        self.used_letters = set()
-        self.last_message = ""
-        self.start_time = pygame.time.get_ticks()
-        self.finished = False
-        self.won = False
-
-    def guess(self, text):
-        if self.finished:
-            return
-        text = text.lower().strip()
-        if not text or not text.isalpha():
-            self.last_message = "Please enter letters only."
-            return
-        if len(text) > 1:
-            # word guess
-            self.attempts += 1
-            if text == self.secret:
-                self.hidden = list(self.secret)
-                self.finish(win=True)
-            else:
-                self.penalty += 5
-                self.last_message = f"Wrong word! Penalties: {self.penalty}/{self.max_penalty}"
-        else:
-            # single letter
-            letter = text
-            if letter in self.used_letters:
-                self.last_message = f"You already tried '{letter}'."
-                return
-            self.used_letters.add(letter)
-            self.attempts += 1
-            if letter in self.secret:
-                for i,c in enumerate(self.secret):
-                    if c == letter:
-                        self.hidden[i] = letter
-                self.last_message = f"Found letter '{letter}'!"
-                if "".join(self.hidden) == self.secret:
-                    self.finish(win=True)
-            else:
-                self.penalty += 1
-                self.last_message = f"Wrong letter! Penalties: {self.penalty}/{self.max_penalty}"
-        if self.penalty >= self.max_penalty:
-            self.finish(win=False)
+        super().__init__(words, difficulty, time_limit, clock=lambda: pygame.time.get_ticks() / 1000.0, log=event_log)
 
     def finish(self, win):
-        self.finished = True
-        self.won = win
+        super().finish(win)
         if win:
-            # record if best
-            best = get_best_score()
-            if best is None or self.attempts < best:
-                save_best_score(self.secret, self.attempts)
-        else:
-            # losing: do nothing
-            pass
-
-    def time_left(self):
-        if self.time_limit is None:
-            return None
-        elapsed = (pygame.time.get_ticks() - self.start_time) / 1000.0
-        return max(0, self.time_limit - elapsed)
+            # record the win (written in best_scores only if it is a new best)
+            scores.add_win(self.secret, self.attempts, self.difficulty)
 
 # ---------- Visuals ----------
 def draw_hangman(surface, x, y, wrong):
@@ -227,24 +234,190 @@ def draw_hangman(surface, x, y, wrong):
     if wrong >= 12:
         pygame.draw.line(surface, (255,0,0), (x-100,y+140),(x+200,y-40),2)
 
-def draw_alphabet(surface, pos, used):
+# alphabet keys geometry
+KEY_W, KEY_H, KEY_GAPX, KEY_GAPY = 36, 34, 6, 6
+KEY_COLS = 7
+KEY_AVAILABLE = (70,120,70)
+KEY_USED = (80,80,80)
+
+# letter -> (available key, used key), pre-rendered once
+alphabet_atlas = {}
+# last composed alphabet block: (used letters, surface)
+alphabet_block = [None, None]
+
+def build_alphabet_atlas():
+    for ch in ALPHABET:
+        keys = []
+        for color in (KEY_AVAILABLE, KEY_USED):
+            key = pygame.Surface((KEY_W, KEY_H), pygame.SRCALPHA)
+            pygame.draw.rect(key, color, key.get_rect(), border_radius=6)
+            draw_text(key, ch.upper(), (10, 6), font=BIG, color=(255,255,255))
+            keys.append(key.convert_alpha())
+        alphabet_atlas[ch] = tuple(keys)
+
+def alphabet_key_rect(i, pos=(0,0)):
     x0,y0 = pos
-    w = 36; h = 34; gapx = 6; gapy = 6
-    cols = 7
-    buttons = []
-    for i,ch in enumerate(ALPHABET):
-        col = i % cols
-        row = i // cols
-        rect = pygame.Rect(x0 + col*(w+gapx), y0 + row*(h+gapy), w, h)
-        color = (70,120,70) if ch not in used else (80,80,80)
-        pygame.draw.rect(surface, color, rect, border_radius=6)
-        draw_text(surface, ch.upper(), (rect.x + 10, rect.y + 6), font=BIG, color=(255,255,255))
-        buttons.append((rect,ch))
-    return buttons
+    col = i % KEY_COLS
+    row = i // KEY_COLS
+    return pygame.Rect(x0 + col*(KEY_W+KEY_GAPX), y0 + row*(KEY_H+KEY_GAPY), KEY_W, KEY_H)
+
+def draw_alphabet(surface, pos, used):
+    # the block is only composed again when the used letters change,
+    # otherwise drawing the alphabet is a single blit
+    used = frozenset(used)
+    if alphabet_block[0] != used:
+        if not alphabet_atlas:
+            build_alphabet_atlas()
+        rows = (len(ALPHABET) + KEY_COLS - 1) // KEY_COLS
+        block = pygame.Surface((KEY_COLS*(KEY_W+KEY_GAPX), rows*(KEY_H+KEY_GAPY)), pygame.SRCALPHA)
+        for i,ch in enumerate(ALPHABET):
+            block.blit(alphabet_atlas[ch][ch in used], alphabet_key_rect(i))
+        alphabet_block[0] = used
+        alphabet_block[1] = block.convert_alpha()
+    surface.blit(alphabet_block[1], pos)
+    return [(alphabet_key_rect(i, pos), ch) for i,ch in enumerate(ALPHABET)]
+
+# ---------- Game screen ----------
+GAME_BG = (12,40,80)
+ALPHA_POS = (620,80)
+HELP_TEXT = "Type a letter or a word (ENTER to submit). Press H for hint."
+OVERLAY_RECT = pygame.Rect(310,310,690,80)
+
+def game_regions(surface, game, typed_buffer):
+    """Regions of the game screen as (name, rect, state, draw).
+    A region only has to be drawn again when its state changes."""
+    best = get_best_score()
+    left = game.time_left()
+    suggested = suggestions(game, typed_buffer)
+
+    def draw_word():
+        draw_text(surface, game.display(), (20,420), font=BIG)
+
+    def draw_status():
+        draw_text(surface, f"Attempts: {game.attempts}", (20,480))
+        draw_text(surface, f"Record (best): {best if best is not None else '-'} attempts", (20,510))
+        draw_text(surface, f"Difficulty: {game.difficulty}", (20,540))
+
+    def draw_typed():
+        pygame.draw.rect(surface, (255,255,255), (400,420,320,36), border_radius=6)
+        draw_text(surface, typed_buffer, (408,427), font=BIG, color=(0,0,0))
+
+    def draw_life():
+        life_pct = max(0, 1 - (game.penalty / game.max_penalty))
+        pygame.draw.rect(surface, (180,180,180), (400,20,300,24), border_radius=8)
+        pygame.draw.rect(surface, (60,200,80), (400,20, int(300*life_pct),24), border_radius=8)
+        draw_text(surface, f"Lives: {game.max_penalty - game.penalty}/{game.max_penalty}", (710,20))
+
+    def draw_timer():
+        if left is not None:
+            draw_text(surface, f"Time left: {int(left)}s", (400,60))
+
+    def draw_message():
+        if game.last_message:
+            draw_text(surface, game.last_message, (400, 500), font=SMALL, color=(255,220,0))
+
+    def draw_suggestions():
+        if suggested:
+            draw_text(surface, "TAB: " + "  ".join(suggested), (400,530), font=SMALL, color=(170,200,255))
+
+    return [
+        ("hangman", (70,90,330,290), game.penalty, lambda: draw_hangman(surface, 180, 220, game.penalty)),
+        ("word", (0,410,398,56), game.revealed, draw_word),
+        ("status", (0,470,398,100), (game.attempts, best, game.difficulty), draw_status),
+        ("typed", (400,420,320,36), typed_buffer, draw_typed),
+        ("alphabet", (620,80,294,160), frozenset(game.used_letters), lambda: draw_alphabet(surface, ALPHA_POS, game.used_letters)),
+        ("life", (400,16,440,32), game.penalty, draw_life),
+        ("timer", (400,56,220,30), None if left is None else int(left), draw_timer),
+        ("message", (400,496,600,26), game.last_message, draw_message),
+        ("suggestions", (400,526,600,26), suggested, draw_suggestions),
+    ]
+
+def draw_overlay(surface, game):
+    # finished overlay
+    if game.finished:
+        if game.won:
+            txt = f"YOU WIN! The word was '{game.secret}'. Attempts: {game.attempts}"
+            draw_text(surface, txt, (320, 320), font=BIG, color=(255,230,160))
+            # best message
+            best_now = get_best_score()
+            if best_now is None or game.attempts <= best_now:
+                draw_text(surface, "🏆 Best ever!!!", (320,360), font=SMALL, color=(255,250,200))
+        else:
+            draw_text(surface, f"GAME OVER! The word was '{game.secret}'.", (320,320), font=BIG, color=(255,100,100))
+        draw_text(surface, "Click anywhere or press ENTER to start a new round.", (320,360))
+
+def draw_game(surface, game, typed_buffer):
+    surface.fill(GAME_BG)
+    regions = game_regions(surface, game, typed_buffer)
+    for name, rect, state, draw in regions:
+        draw()
+    draw_text(surface, HELP_TEXT, (400,460))
+    draw_overlay(surface, game)
+    return regions
+
+class DirtyRenderer:
+    """Opt-in renderer: only the regions whose state changed are drawn again
+    and only their rectangles are sent to the display."""
+    def __init__(self, surface):
+        self.surface = surface
+        self.states = {}
+        self.scene = None
+
+    def invalidate(self):
+        self.scene = None
+
+    def render(self, game, typed_buffer):
+        scene = (game.finished, game.won, game.secret)
+        if scene != self.scene:
+            # new round / end of round (the overlay changes): draw everything once
+            self.scene = scene
+            regions = draw_game(self.surface, game, typed_buffer)
+            self.states = {name: state for name, rect, state, draw in regions}
+            pygame.display.flip()
+            return
+        dirty = []
+        for name, rect, state, draw in game_regions(self.surface, game, typed_buffer):
+            if self.states.get(name) == state:
+                continue
+            self.states[name] = state
+            rect = pygame.Rect(rect)
+            self.surface.set_clip(rect)
+            self.surface.fill(GAME_BG, rect)
+            draw()
+            dirty.append(rect)
+        if game.finished:
+            # put back the part of the overlay that was under a redrawn region
+            for rect in dirty:
+                if rect.colliderect(OVERLAY_RECT):
+                    self.surface.set_clip(rect)
+                    draw_overlay(self.surface, game)
+        self.surface.set_clip(None)
+        if dirty:
+            pygame.display.update(dirty)
+
+# ---------- Profiling ----------
+# opt-in, see frame_profiler.py: HANGMAN_PROFILE=1 python3 hangman_pygame.py (F3: overlay)
+# when it is off nothing is wrapped and the game loop only tests `if profiler`
+PROFILE_PHASES = ["events", "timer", "draw", "flip", "overlay", "idle"]
+PROFILE_FUNCTIONS = ["draw_hangman", "draw_alphabet", "get_best_score", "render_text"]
+PROFILE_RECT = pygame.Rect(700,404,300,196)
+profiler = None
+if frame_profiler.ENABLED:
+    profiler = frame_profiler.FrameProfiler(PROFILE_PHASES, PROFILE_FUNCTIONS, trace=frame_profiler.TRACE)
+    for _name in PROFILE_FUNCTIONS:
+        globals()[_name] = profiler.timed(_name, globals()[_name])
+    atexit.register(profiler.close)
+
+def draw_profile_overlay(surface):
+    surface.fill((0,0,0), PROFILE_RECT)
+    for i, line in enumerate(profiler.overlay_lines()):
+        draw_text(surface, line, (PROFILE_RECT.x + 6, PROFILE_RECT.y + 4 + i*18), font=SMALL, color=(0,255,0))
+    pygame.display.update(PROFILE_RECT)
 
 # ---------- Main UI flow ----------
 def main():
-    words = load_words_from_args_or_default()
+    check_word_file()
+    init_display()
     # start menu options
     difficulty = "medium"
     use_timer = False
@@ -273,9 +446,11 @@ def main():
         draw_text(screen, "Controls:", (20,320))
         draw_text(screen, "- Click letters on the right or type on keyboard", (20,350))
         draw_text(screen, "- Press H for hint (costs attempts)", (20,380))
-        draw_text(screen, "- Press ENTER to submit typed word", (20,410))
+        draw_text(screen, "- Press ENTER to submit typed word, TAB to complete it", (20,410))
 
         pygame.display.flip()
+        if not startup.milestones:
+            startup.milestone("first frame (menu)")
         ev = pygame.event.wait()
         if ev.type == pygame.QUIT:
             pygame.quit(); sys.exit(0)
@@ -308,22 +483,48 @@ def main():
             if pygame.Rect(200,240,100,42).collidepoint(ev.pos):
                 pygame.quit(); sys.exit(0)
 
+    # word list loaded when it is needed (the menu is already on screen)
+    with startup.phase("word list"):
+        words = WordPool(load_words_from_args_or_default(), deck=True)
+        if DIFFICULTY_INDEX:
+            from difficulty_index import difficulty_index, apply_index
+            if not apply_index(words, difficulty_index(words)):
+                print("difficulty index not in order for this word list, word length used instead")
+    with startup.phase("autocomplete"):
+        get_completer(words)
     # create game object
     game = HangmanGame(words, difficulty=difficulty, time_limit=time_limit)
     typed_buffer = ""
-    alpha_buttons = []  # store rects
+    alpha_buttons = [(alphabet_key_rect(i, ALPHA_POS), ch) for i,ch in enumerate(ALPHABET)]
     message_timer = 0
+    renderer = DirtyRenderer(screen) if DIRTY_RECTS else None
+    # no fixed frame rate: frames are drawn on events, on each second of the timer
+    # and at FPS only for a moment after an event (see frame_scheduler.py)
+    scheduler = FrameScheduler(FPS)
+    scheduler.animate(scheduler.linger)  # first frames right away
 
     # main game loop
     while True:
-        screen.fill((12,40,80))
+        if profiler:
+            profiler.begin_frame()
+        # wait for events (or the next second of the timer)
+        events = scheduler.wait(next_second(None if game.finished else game.time_left()))
+        if profiler:
+            profiler.mark("idle")
         # events
-        for ev in pygame.event.get():
+        for ev in events:
             if ev.type == pygame.QUIT:
                 pygame.quit(); sys.exit(0)
+            if ev.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED) and renderer:
+                renderer.invalidate()
             if ev.type == pygame.KEYDOWN:
                 if ev.key == pygame.K_ESCAPE:
                     pygame.quit(); sys.exit(0)
+                if ev.key == pygame.K_F3 and profiler:
+                    profiler.overlay = not profiler.overlay
+                    if renderer:
+                        renderer.invalidate()
+                    continue
                 if game.finished:
                     if ev.key == pygame.K_RETURN:
                         game.reset_round()
@@ -335,22 +536,16 @@ def main():
                         if typed_buffer:
                             game.guess(typed_buffer)
                             typed_buffer = ""
+                    elif ev.key == pygame.K_TAB:
+                        # complete the typed word with the first suggestion
+                        suggested = suggestions(game, typed_buffer)
+                        if suggested:
+                            typed_buffer = suggested[0]
                     elif ev.key == pygame.K_h:
-                        # hint: reveal one unseen letter (cost attempts)
-                        unrevealed = [c for c,h in zip(game.secret, game.hidden) if h == "_"]
-                        if unrevealed:
-                            letter = random.choice(unrevealed)
-                            # apply as if the user guessed letter
-                            if letter not in game.used_letters:
-                                game.used_letters.add(letter)
-                            # reveal occurrences but apply penalty
-                            for i,c in enumerate(game.secret):
-                                if c == letter:
-                                    game.hidden[i] = c
-                            game.attempts += HINT_PENALTY
-                            game.last_message = f"Hint revealed '{letter}' (-{HINT_PENALTY} attempts)."
-                            if "".join(game.hidden) == game.secret:
-                                game.finish(win=True)
+                        # hint: reveal one unseen letter (cost attempts),
+                        # the solver picks the most useful one when numpy is there
+                        smart = get_solver(words)
+                        game.hint(smart.hint_letter(game) if smart else None)
                     else:
                         ch = ev.unicode
                         if ch and ch.isalpha():
@@ -367,57 +562,40 @@ def main():
                     game.reset_round()
                     typed_buffer = ""
 
-        # draw hangman and UI
-        draw_hangman(screen, 180, 220, game.penalty)
-
-        # word display
-        word_display = " ".join(game.hidden)
-        draw_text(screen, word_display, (20,420), font=BIG)
-        draw_text(screen, f"Attempts: {game.attempts}", (20,480))
-        best = get_best_score()
-        draw_text(screen, f"Record (best): {best if best is not None else '-'} attempts", (20,510))
-        draw_text(screen, f"Difficulty: {game.difficulty}", (20,540))
-
-        # typed buffer
-        pygame.draw.rect(screen, (255,255,255), (400,420,320,36), border_radius=6)
-        draw_text(screen, typed_buffer, (408,427), font=BIG, color=(0,0,0))
-        draw_text(screen, "Type a letter or a word (ENTER to submit). Press H for hint.", (400,460))
-
-        # alphabet block
-        alpha_buttons = draw_alphabet(screen, (620,80), game.used_letters)
-
-        # draw life bar
-        life_pct = max(0, 1 - (game.penalty / game.max_penalty))
-        pygame.draw.rect(screen, (180,180,180), (400,20,300,24), border_radius=8)
-        pygame.draw.rect(screen, (60,200,80), (400,20, int(300*life_pct),24), border_radius=8)
-        draw_text(screen, f"Lives: {game.max_penalty - game.penalty}/{game.max_penalty}", (710,20))
+        if profiler:
+            profiler.mark("events")
 
         # timer
         if game.time_limit:
             left = game.time_left()
-            draw_text(screen, f"Time left: {int(left)}s", (400,60))
             if left <= 0 and not game.finished:
                 game.finish(win=False)
+        if profiler:
+            profiler.mark("timer")
 
-        # messages
-        if game.last_message:
-            draw_text(screen, game.last_message, (400, 500), font=SMALL, color=(255,220,0))
-
-        # finished overlay
-        if game.finished:
-            if game.won:
-                txt = f"YOU WIN! The word was '{game.secret}'. Attempts: {game.attempts}"
-                draw_text(screen, txt, (320, 320), font=BIG, color=(255,230,160))
-                # best message
-                best_now = get_best_score()
-                if best_now is None or game.attempts <= best_now:
-                    draw_text(screen, "🏆 Best ever!!!", (320,360), font=SMALL, color=(255,250,200))
-            else:
-                draw_text(screen, f"GAME OVER! The word was '{game.secret}'.", (320,320), font=BIG, color=(255,100,100))
-            draw_text(screen, "Click anywhere or press ENTER to start a new round.", (320,360))
-
-        pygame.display.flip()
-        clock.tick(FPS)
+        # draw hangman and UI
+        if renderer:
+            renderer.render(game, typed_buffer)
+            if profiler:
+                profiler.mark("draw")
+        else:
+            draw_game(screen, game, typed_buffer)
+            if profiler:
+                profiler.mark("draw")
+            pygame.display.flip()
+            if profiler:
+                profiler.mark("flip")
+        if profiler and profiler.overlay:
+            draw_profile_overlay(screen)
+            profiler.mark("overlay")
+        if len(startup.milestones) == 1:
+            startup.milestone("first game frame")
+            startup.report()
+        if profiler:
+            profiler.end_frame(idle=("idle",))
+            if profiler.overlay:
+                # keep the overlay numbers moving
+                scheduler.animate(1.0)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,149 @@
+# hangman_server.py
+# Many hangman games in one process: asyncio TCP server, one session per connection,
+# every session plays with the rules of hangman_engine.py on the same WordPool.
+# Usage:
+#   python3 hangman_server.py [words.txt] [--host 127.0.0.1] [--port 7777] [--idle 300]
+#
+# Line protocol (one command per line, one reply per line):
+#   <letter or word>   -> FOUND|MISSED|ALREADY|INVALID|OVER <word> <penalty>/<max> PLAYING|WON|LOST [secret]
+#   /HINT              -> HINT <letter> <word> <penalty>/<max> PLAYING|WON|LOST [secret]
+#   /NEW [difficulty]  -> NEW <word> 0/<max> PLAYING
+#   /QUIT              -> BYE
+# Commands start with "/" so that a guess ("new", "hint", "quit" are words too)
+# is never taken for a command; an unknown command is answered with ERROR.
+# <word> is the hidden word with "_" for the letters not found yet, e.g. "_a__e".
+# The connection starts with a NEW reply (medium difficulty).
+
+import argparse
+import asyncio
+import os
+import time
+import game_log
+from corpus_cache import load_corpus
+from hangman_engine import HangmanGame
+from word_pool import WordPool, DEFAULT_WORDS
+
+IDLE_TIMEOUT = 300   # seconds without a command before the session is closed
+SWEEP_EVERY = 5      # seconds between two looks for idle sessions
+
+def state(game):
+    hidden = "".join(game.hidden)
+    text = f"{hidden} {game.penalty}/{game.max_penalty} "
+    if not game.finished:
+        return text + "PLAYING"
+    return text + ("WON " if game.won else "LOST ") + game.secret
+
+class Session:
+    def __init__(self, pool, writer, clock, log=None):
+        self.writer = writer
+        self.clock = clock
+        self.last_active = clock()
+        self.game = HangmanGame(pool, clock=clock, log=log)
+
+    def handle(self, line):
+        """One command -> the reply line (without the newline), None to close."""
+        self.last_active = self.clock()
+        command, _, arg = line.strip().partition(" ")
+        game = self.game
+        if not command.startswith("/"):
+            return game.guess(command).upper() + " " + state(game)
+        upper = command.upper()
+        if upper == "/QUIT":
+            return None
+        if upper == "/NEW":
+            if arg:
+                game.difficulty = arg.strip().lower()
+            game.reset_round()
+            return "NEW " + state(game)
+        if upper == "/HINT":
+            letter = game.hint()
+            return f"HINT {letter or '-'} " + state(game)
+        return "ERROR unknown command " + command
+
+class HangmanServer:
+    def __init__(self, words, idle_timeout=IDLE_TIMEOUT):
+        # one pool for every session: the words are indexed once
+        self.pool = words if isinstance(words, WordPool) else WordPool(words)
+        self.idle_timeout = idle_timeout
+        self.sessions = set()
+        self.games_played = 0
+        self.clock = time.monotonic
+        # HANGMAN_EVENT_LOG=<directory>: one event log for all the sessions (see game_log.py)
+        self.log = game_log.from_env()
+
+    async def handle_client(self, reader, writer):
+        session = Session(self.pool, writer, self.clock, self.log)
+        self.sessions.add(session)
+        try:
+            writer.write(("NEW " + state(session.game) + "\n").encode())
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                finished = session.game.finished
+                reply = session.handle(line.decode("utf-8", "replace"))
+                if reply is None:
+                    writer.write(b"BYE\n")
+                    break
+                if session.game.finished and not finished:
+                    self.games_played += 1
+                writer.write(reply.encode() + b"\n")
+                # only wait when the client does not read fast enough
+                if writer.transport.get_write_buffer_size() > 64 * 1024:
+                    await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self.sessions.discard(session)
+            writer.close()
+
+    async def evict_idle(self):
+        """Close the sessions idle for more than idle_timeout (one task for all the sessions)."""
+        while True:
+            await asyncio.sleep(SWEEP_EVERY)
+            limit = self.clock() - self.idle_timeout
+            for session in [s for s in self.sessions if s.last_active < limit]:
+                self.sessions.discard(session)
+                session.writer.close()
+
+    async def start(self, host="127.0.0.1", port=7777):
+        self.server = await asyncio.start_server(self.handle_client, host, port, backlog=4096)
+        self.sweeper = asyncio.ensure_future(self.evict_idle())
+        return self.server
+
+    def close(self):
+        self.sweeper.cancel()
+        self.server.close()
+
+def load_server_words(path):
+    if path is None:
+        return DEFAULT_WORDS
+    # compiled word list, shared by every session (see corpus_cache.py)
+    words = load_corpus(path)
+    if not len(words):
+        raise SystemExit(f"no valid words in {path}")
+    return words
+
+async def serve(args):
+    server = HangmanServer(load_server_words(args.words), args.idle)
+    tcp = await server.start(args.host, args.port)
+    print(f"hangman server on {args.host}:{args.port} ({len(server.pool)} words)")
+    async with tcp:
+        await tcp.serve_forever()
+
+def main():
+    parser = argparse.ArgumentParser(description="Hangman asyncio server")
+    parser.add_argument("words", nargs="?", help="word list file (default: built-in list)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=7777)
+    parser.add_argument("--idle", type=float, default=IDLE_TIMEOUT, help="idle timeout in seconds")
+    args = parser.parse_args()
+    if args.words is not None and not os.path.exists(args.words):
+        parser.error(f"file '{args.words}' not found")
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+# load_test.py
+# Load generator for hangman_server.py: opens many local connections at once,
+# each one plays games by guessing letters in English frequency order.
+# Reports the guess latency (p50 / p99) and the games (sessions) per second.
+# Usage:
+#   python3 load_test.py [--clients 2000] [--games 5]            # starts a server in this process
+#   python3 load_test.py --port 7777 --no-server                   # against a running server
+
+import argparse
+import asyncio
+import time
+from hangman_server import HangmanServer, load_server_words
+
+ORDER = "etaoinshrdlcumwfgypbvkjxqz"
+
+def raise_file_limit(needed):
+    # every connection is a file descriptor (two when the server runs in this process)
+    try:
+        import resource
+    except ImportError:
+        return
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft < needed:
+        target = needed if hard == resource.RLIM_INFINITY else min(needed, hard)
+        resource.setrlimit(resource.RLIMIT_NOFILE, (target, hard))
+
+async def client(host, port, games, latencies, start_gate):
+    """Play `games` games on one connection, returns the number of games finished."""
+    await start_gate.wait()
+    reader, writer = await asyncio.open_connection(host, port)
+    await reader.readline()  # NEW ...
+    finished = 0
+    for game in range(games):
+        if game:
+            writer.write(b"/NEW\n")
+            await reader.readline()
+        for letter in ORDER:
+            t = time.perf_counter()
+            writer.write(letter.encode() + b"\n")
+            reply = await reader.readline()
+            latencies.append(time.perf_counter() - t)
+            if not reply.rstrip().endswith(b"PLAYING"):
+                finished += 1
+                break
+    writer.write(b"/QUIT\n")
+    await reader.readline()
+    writer.close()
+    return finished
+
+def percentile(sorted_values, p):
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * p / 100))]
+
+async def run(args):
+    server = None
+    if not args.no_server:
+        server = HangmanServer(load_server_words(args.words))
+        tcp = await server.start(args.host, args.port)
+        args.port = tcp.sockets[0].getsockname()[1]
+    latencies = []
+    start_gate = asyncio.Event()
+    tasks = [asyncio.ensure_future(client(args.host, args.port, args.games, latencies, start_gate))
+             for _ in range(args.clients)]
+    start = time.perf_counter()
+    start_gate.set()
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    elapsed = time.perf_counter() - start
+    if server is not None:
+        server.close()
+
+    errors = [r for r in results if isinstance(r, BaseException)]
+    games = sum(r for r in results if not isinstance(r, BaseException))
+    latencies.sort()
+    print(f"clients: {args.clients}, games: {games}, guesses: {len(latencies)}, errors: {len(errors)}")
+    if errors:
+        print(f"  first error: {errors[0]!r}")
+    print(f"elapsed: {elapsed:.2f} s, {games / elapsed:,.0f} sessions/s, {len(latencies) / elapsed:,.0f} guesses/s")
+    print(f"guess latency: p50 {percentile(latencies, 50) * 1000:.2f} ms, "
+          f"p99 {percentile(latencies, 99) * 1000:.2f} ms, max {latencies[-1] * 1000 if latencies else 0:.2f} ms")
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test for hangman_server.py")
+    parser.add_argument("words", nargs="?", help="word list for the in-process server (default: built-in list)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=0, help="server port (0 = any free port for the in-process server)")
+    parser.add_argument("--clients", type=int, default=2000, help="concurrent connections")
+    parser.add_argument("--games", type=int, default=5, help="games per connection")
+    parser.add_argument("--no-server", action="store_true", help="do not start a server, connect to --port")
+    args = parser.parse_args()
+    if args.no_server and not args.port:
+        parser.error("--no-server needs --port")
+    raise_file_limit(2 * args.clients + 64)
+    asyncio.run(run(args))
+
+if __name__ == "__main__":
+    main()
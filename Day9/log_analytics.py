@@ -0,0 +1,150 @@
+# log_analytics.py
+# Statistics over the game event log of game_log.py, read as a stream:
+# each segment is read chunk by chunk (memory does not depend on the log size,
+# only on the number of distinct words), segments are processed in parallel.
+# Usage:
+#   python3 log_analytics.py <log directory or segment files...> [--workers N] [--top 10] [--json]
+
+import argparse
+import json
+import os
+import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from game_log import iter_records, list_segments, END, GUESS, HINT, WIN, LOSS, RESULT_CODES
+from hangman_engine import FOUND, MISSED, INVALID
+
+FOUND_CODE = RESULT_CODES[FOUND]
+MISSED_CODE = RESULT_CODES[MISSED]
+INVALID_CODE = RESULT_CODES[INVALID]
+
+class Stats:
+    def __init__(self):
+        self.words = {}               # word -> [games, wins]
+        self.letters = {}             # letter -> [guesses, hits]
+        self.attempts = Counter()     # attempts of the won games
+        self.events = Counter()       # record type -> count
+        self.hints = 0
+        self.invalid = 0              # guesses refused by the engine (not letters)
+
+    def add_segment(self, path):
+        words = self.words
+        letters = self.letters
+        events = self.events
+        for kind, game_id, body in iter_records(path):
+            events[kind] += 1
+            if kind == GUESS:
+                # invalid guesses are counted, letter stats: single letters (code + 1 byte), FOUND / MISSED only
+                code = body[0]
+                if code == INVALID_CODE:
+                    self.invalid += 1
+                elif len(body) == 2 and (code == FOUND_CODE or code == MISSED_CODE):
+                    letter = chr(body[1])
+                    count = letters.get(letter)
+                    if count is None:
+                        count = letters[letter] = [0, 0]
+                    count[0] += 1
+                    count[1] += code == FOUND_CODE
+            elif kind == WIN or kind == LOSS:
+                attempts, penalty = END.unpack_from(body)
+                word = body[END.size:].decode("utf-8", "replace")
+                count = words.get(word)
+                if count is None:
+                    count = words[word] = [0, 0]
+                count[0] += 1
+                if kind == WIN:
+                    count[1] += 1
+                    self.attempts[attempts] += 1
+            elif kind == HINT:
+                self.hints += 1
+        return self
+
+    def merge(self, other):
+        for word, (games, wins) in other.words.items():
+            count = self.words.setdefault(word, [0, 0])
+            count[0] += games
+            count[1] += wins
+        for letter, (guesses, hits) in other.letters.items():
+            count = self.letters.setdefault(letter, [0, 0])
+            count[0] += guesses
+            count[1] += hits
+        self.attempts.update(other.attempts)
+        self.events.update(other.events)
+        self.hints += other.hints
+        self.invalid += other.invalid
+        return self
+
+    def summary(self, top=10, min_games=3):
+        games = sum(g for g, w in self.words.values())
+        wins = sum(w for g, w in self.words.values())
+        rated = [(w / g, g, word) for word, (g, w) in self.words.items() if g >= min_games]
+        rated.sort()
+        return {
+            "games": games,
+            "wins": wins,
+            "win_rate": wins / games if games else None,
+            "hints": self.hints,
+            "invalid_guesses": self.invalid,
+            "attempts": dict(sorted(self.attempts.items())),
+            "letter_hit_rate": {c: hits / guesses for c, (guesses, hits) in sorted(self.letters.items())},
+            "hardest_words": [(word, rate, g) for rate, g, word in rated[:top]],
+            "easiest_words": [(word, rate, g) for rate, g, word in reversed(rated[-top:])],
+        }
+
+def analyse_segment(path):
+    return Stats().add_segment(path)
+
+def analyse(paths, workers=None):
+    stats = Stats()
+    if len(paths) > 1 and workers != 1:
+        with ProcessPoolExecutor(workers) as executor:
+            for part in executor.map(analyse_segment, paths):
+                stats.merge(part)
+    else:
+        for path in paths:
+            stats.add_segment(path)
+    return stats
+
+def print_summary(s):
+    if not s["games"]:
+        print("no finished game in the log")
+        return
+    print(f"games: {s['games']}, won: {s['wins']} ({s['win_rate']:.1%}), hints: {s['hints']}, "
+          f"invalid guesses: {s['invalid_guesses']}")
+    print("attempts of the won games:")
+    peak = max(s["attempts"].values())
+    for attempts, n in s["attempts"].items():
+        print(f"  {attempts:3d} {n:8d} {'#' * max(1, round(40 * n / peak))}")
+    print("letter hit rate:")
+    print("  " + "  ".join(f"{c} {rate:.0%}" for c, rate in s["letter_hit_rate"].items()))
+    print("hardest words:")
+    for word, rate, games in s["hardest_words"]:
+        print(f"  {word:16s} {rate:6.1%} of {games} games")
+    print("easiest words:")
+    for word, rate, games in s["easiest_words"]:
+        print(f"  {word:16s} {rate:6.1%} of {games} games")
+
+def main():
+    parser = argparse.ArgumentParser(description="Statistics over the hangman event log (game_log.py)")
+    parser.add_argument("paths", nargs="+", help="log directory or segment files")
+    parser.add_argument("--workers", type=int, default=None, help="processes (default: one per core)")
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--min-games", type=int, default=3, help="games needed to rank a word")
+    parser.add_argument("--json", action="store_true", help="print the summary as JSON")
+    args = parser.parse_args()
+
+    segments = []
+    for path in args.paths:
+        segments.extend(list_segments(path) if os.path.isdir(path) else [path])
+    if not segments:
+        print("no log segment found")
+        sys.exit(1)
+    summary = analyse(segments, args.workers).summary(args.top, args.min_games)
+    if args.json:
+        json.dump(summary, sys.stdout, indent=2)
+        print()
+    else:
+        print_summary(summary)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+# score_store.py
+# Best-score store shared by hangman.py (terminal) and hangman_pygame.py.
+#
+# - the text file "best_scores" keeps its format (one line per new record),
+#   lines are parsed once and the best score is kept in memory;
+#   the file is only re-read when its size / mtime changes (and only the new lines when it grew)
+# - new records are appended right away, the database inserts are batched
+#   and flushed at exit (or when the batch is full)
+# - every win is also stored in a small SQLite database (stdlib) with indexes
+#   on (difficulty, attempts) and (word, attempts), for leaderboard queries
+
+import os
+import atexit
+import sqlite3
+from datetime import datetime
+
+BEST_FILE = "best_scores"
+
+def parse_attempts(line):
+    # "2025-09-18 13:06:50 - word: school - attempts: 6" -> 6
+    if "attempts:" not in line:
+        return None
+    try:
+        return int(line.split("attempts:")[-1].strip())
+    except ValueError:
+        return None
+
+def format_line(word, attempts, date=None):
+    if date is None:
+        date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    return f"{date} - word: {word} - attempts: {attempts}\n"
+
+class ScoreStore:
+    def __init__(self, path=BEST_FILE, db_path=None, batch_size=16):
+        self.path = path
+        self.db_path = db_path if db_path is not None else path + ".db"
+        self.batch_size = batch_size
+        self._best = None
+        self._stat = None     # (mtime_ns, size) of the file when it was last read
+        self._offset = 0      # bytes of the file already parsed
+        self._rows = []       # rows waiting to be inserted in the database
+        self._db = None
+        atexit.register(self.close)
+
+    # ---------- best score (text file) ----------
+    def _refresh(self):
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            self._stat = None
+            self._offset = 0
+            self._best = None
+            return
+        key = (st.st_mtime_ns, st.st_size)
+        if key == self._stat:
+            return
+        if st.st_size < self._offset:
+            # file was truncated or replaced: parse it again from the start
+            self._offset = 0
+            self._best = None
+        with open(self.path, "rb") as f:
+            f.seek(self._offset)
+            data = f.read()
+        # only parse complete lines, a partial last line will be read next time
+        end = data.rfind(b"\n") + 1
+        for raw in data[:end].splitlines():
+            n = parse_attempts(raw.decode("utf-8", "replace"))
+            if n is not None and (self._best is None or n < self._best):
+                self._best = n
+        self._offset += end
+        self._stat = key
+
+    def best(self):
+        self._refresh()
+        return self._best
+
+    def add_win(self, word, attempts, difficulty=None):
+        """Record a win. Returns True if it is a new best score
+        (only new records are written in the text file, like before)."""
+        self._rows.append((word, difficulty, attempts, datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
+        best = self.best()
+        is_best = best is None or attempts < best
+        if is_best:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(format_line(word, attempts))
+            # our own append: parse it now instead of waiting for the next call
+            self._refresh()
+        if len(self._rows) >= self.batch_size:
+            self.flush()
+        return is_best
+
+    def flush(self):
+        if self._rows:
+            db = self._connect()
+            with db:
+                db.executemany("INSERT INTO scores(word, difficulty, attempts, date) VALUES (?,?,?,?)", self._rows)
+            self._rows = []
+
+    def compact(self):
+        """Rewrite the text file keeping only the lines that were a new record
+        when they were written (the history of the best score)."""
+        self.flush()
+        if not os.path.exists(self.path):
+            return
+        kept = []
+        best = None
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                n = parse_attempts(line)
+                if n is not None and (best is None or n < best):
+                    best = n
+                    kept.append(line if line.endswith("\n") else line + "\n")
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.writelines(kept)
+        os.replace(tmp, self.path)
+        self._stat = None
+        self._offset = 0
+        self._best = None
+
+    # ---------- leaderboard (SQLite) ----------
+    def _connect(self):
+        if self._db is None:
+            self._db = sqlite3.connect(self.db_path)
+            self._db.executescript("""
+                CREATE TABLE IF NOT EXISTS scores(
+                    id INTEGER PRIMARY KEY,
+                    word TEXT NOT NULL,
+                    difficulty TEXT,
+                    attempts INTEGER NOT NULL,
+                    date TEXT NOT NULL);
+                CREATE INDEX IF NOT EXISTS scores_difficulty ON scores(difficulty, attempts);
+                CREATE INDEX IF NOT EXISTS scores_word ON scores(word, attempts);
+                CREATE INDEX IF NOT EXISTS scores_attempts ON scores(attempts);
+            """)
+        return self._db
+
+    def leaderboard(self, difficulty=None, word=None, limit=10):
+        """Best wins as (word, difficulty, attempts, date), fewest attempts first."""
+        self.flush()
+        db = self._connect()
+        if word is not None:
+            query = "SELECT word, difficulty, attempts, date FROM scores WHERE word = ? ORDER BY attempts LIMIT ?"
+            args = (word, limit)
+        elif difficulty is not None:
+            query = "SELECT word, difficulty, attempts, date FROM scores WHERE difficulty = ? ORDER BY attempts LIMIT ?"
+            args = (difficulty, limit)
+        else:
+            query = "SELECT word, difficulty, attempts, date FROM scores ORDER BY attempts LIMIT ?"
+            args = (limit,)
+        return db.execute(query, args).fetchall()
+
+    def close(self):
+        self.flush()
+        if self._db is not None:
+            self._db.close()
+            self._db = None
@@ -0,0 +1,188 @@
+# solver.py
+# Hangman solver / AI player with NumPy.
+# The word list is stored once as uint8 matrices grouped by length
+# (one row per word, one column per letter, values 0-25), so the words
+# matching the current pattern are found with a few vectorized masks
+# (one comparison per revealed position and per used letter).
+# Usage (automated player over a word list):
+#   python3 solver.py [words.txt] [--strategy frequency|entropy]
+
+import sys
+import time
+import numpy as np
+
+ALPHABET = "abcdefghijklmnopqrstuvwxyz"
+# used when the secret is not in the word list (no candidate left)
+ENGLISH_ORDER = "etaoinshrdlcumwfgypbvkjxqz"
+LETTER_CODES = np.arange(26, dtype=np.uint8)
+# letter -> row of counts / scores; the letters outside a-z (accents...) are in no word of the solver
+LETTER_INDEX = {c: i for i, c in enumerate(ALPHABET)}
+# exact information gain is only computed below this number of candidates,
+# above it the letter frequency is used (same choice most of the time, much cheaper)
+ENTROPY_MAX_CANDIDATES = 500
+
+class Solver:
+    def __init__(self, words):
+        groups = {}
+        for w in words:
+            if w.isascii() and w.isalpha() and w.islower():
+                groups.setdefault(len(w), []).append(w)
+        self.words = {}      # length -> list of words
+        self.columns = {}    # length -> uint8 matrix (length x words), letter codes by position
+        self.counts = {}     # length -> uint8 matrix (26 x words), occurrences of each letter
+        self.present = {}    # length -> float32 matrix (26 x words), 1 if the letter is in the word
+        for n, ws in groups.items():
+            m = np.frombuffer("".join(ws).encode("ascii"), dtype=np.uint8).reshape(len(ws), n) - ord("a")
+            counts = np.zeros((26, len(ws)), dtype=np.uint8)
+            index = np.arange(len(ws))
+            for i in range(n):
+                # one letter per word in a column: no duplicate (letter, word) pair
+                counts[m[:, i], index] += 1
+            self.words[n] = ws
+            self.columns[n] = np.ascontiguousarray(m.T)
+            self.counts[n] = counts
+            self.present[n] = (counts > 0).astype(np.float32)
+
+    def candidates_mask(self, hidden, used):
+        """Boolean array over self.words[len(hidden)]: words matching the pattern
+        (revealed letters exactly at their positions, no missed letter)."""
+        n = len(hidden)
+        counts = self.counts[n]
+        columns = self.columns[n]
+        keep = np.ones(len(self.words[n]), dtype=bool)
+        revealed = {}
+        for i, c in enumerate(hidden):
+            if c != "_":
+                code = LETTER_INDEX.get(c)
+                if code is None:
+                    # revealed letter outside a-z: no word of the solver matches
+                    keep[:] = False
+                    return keep
+                keep &= columns[i] == code
+                revealed[code] = revealed.get(code, 0) + 1
+        # a revealed letter is revealed everywhere: same number of occurrences
+        for code, k in revealed.items():
+            keep &= counts[code] == k
+        # a used letter that is not revealed is not in the word
+        for c in used:
+            code = LETTER_INDEX.get(c)
+            if code is not None and code not in revealed:
+                keep &= counts[code] == 0
+        return keep
+
+    def candidates_index(self, hidden, used):
+        if len(hidden) not in self.words:
+            return np.zeros(0, dtype=np.intp)
+        return np.flatnonzero(self.candidates_mask(hidden, used))
+
+    def candidates(self, hidden, used):
+        words = self.words.get(len(hidden), [])
+        return [words[i] for i in self.candidates_index(hidden, used)]
+
+    def scores(self, hidden, used, strategy="frequency"):
+        """Score of each letter (array of 26, higher is better, -1 for used letters)."""
+        n = len(hidden)
+        result = np.full(26, -1.0)
+        keep = self.candidates_mask(hidden, used) if n in self.words else None
+        total = 0 if keep is None else int(np.count_nonzero(keep))
+        if total == 0:
+            for rank, c in enumerate(ENGLISH_ORDER):
+                result[ord(c) - ord("a")] = 26 - rank
+        elif strategy == "entropy" and total <= ENTROPY_MAX_CANDIDATES and n <= 56:
+            # information gain: entropy of the groups of candidates made by
+            # the positions where each letter appears (absent = one group)
+            m = self.columns[n][:, keep]
+            # keys[c, w] = bitmask of the positions of letter c in word w
+            # (smallest unsigned type that holds n bits, comparisons stay in uint8)
+            dtype = np.uint16 if n <= 16 else np.uint32 if n <= 32 else np.int64
+            keys = np.zeros((26, total), dtype=dtype)
+            for i in range(n):
+                keys |= (m[i] == LETTER_CODES[:, None]).astype(dtype) << dtype(i)
+            # one (letter, mask) key per word and letter, the groups are the equal keys
+            flat = (keys.astype(np.int64) + (np.arange(26, dtype=np.int64)[:, None] << n)).ravel()
+            if (26 << n) <= 8 * len(flat):
+                # few possible keys: count them with bincount
+                groups = np.bincount(flat, minlength=26 << n)
+                index = np.flatnonzero(groups)
+                sizes = groups[index]
+            else:
+                index, sizes = np.unique(flat, return_counts=True)
+            letters = index >> n
+            plogp = np.bincount(letters, weights=sizes * np.log2(sizes), minlength=26)
+            result[:] = np.log2(total) - plogp / total
+        else:
+            # frequency: number of candidate words containing the letter
+            # (also used for "entropy" while there are too many candidates)
+            result[:] = self.present[n] @ keep.astype(np.float32)
+        for c in used:
+            if c in LETTER_INDEX:
+                result[LETTER_INDEX[c]] = -1
+        return result
+
+    def best_letter(self, hidden, used, strategy="frequency"):
+        s = self.scores(hidden, used, strategy)
+        code = int(s.argmax())
+        if s[code] < 0:
+            return None
+        return ALPHABET[code]
+
+    def hint_letter(self, game, strategy="frequency"):
+        """Smart hint: the unrevealed letter of the secret that the solver rates best."""
+        s = self.scores(game.hidden, game.used_letters, strategy)
+        # letters outside a-z are not scored: None -> the game picks a random hint
+        letters = {c for c, h in zip(game.secret, game.hidden) if h == "_" and c in LETTER_INDEX}
+        if not letters:
+            return None
+        return max(letters, key=lambda c: s[LETTER_INDEX[c]])
+
+    def next_guess(self, game, strategy="frequency"):
+        rows = self.candidates_index(game.hidden, game.used_letters)
+        if len(rows) == 1:
+            # only one word left: guess the whole word
+            return self.words[len(game.hidden)][rows[0]]
+        return self.best_letter(game.hidden, game.used_letters, strategy)
+
+    def play(self, game, strategy="frequency"):
+        """Automated player: plays the round until it is finished."""
+        while not game.finished:
+            guess = self.next_guess(game, strategy)
+            if guess is None:
+                break
+            game.guess(guess)
+        return game
+
+def main():
+    from hangman_engine import HangmanGame
+    from word_pool import WordPool, DEFAULT_WORDS
+
+    args = sys.argv[1:]
+    strategy = "frequency"
+    if "--strategy" in args:
+        i = args.index("--strategy")
+        strategy = args[i + 1]
+        del args[i:i + 2]
+    if args:
+        with open(args[0], "r", encoding="utf-8") as f:
+            words = [line.strip().lower() for line in f if line.strip().isalpha()]
+    else:
+        words = DEFAULT_WORDS
+
+    start = time.perf_counter()
+    solver = Solver(words)
+    print(f"solver built for {len(words)} words in {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    pool = WordPool(words, deck=True)
+    game = HangmanGame(pool, clock=lambda: 0.0)
+    rounds = min(len(words), 1000)
+    wins = moves = 0
+    start = time.perf_counter()
+    for _ in range(rounds):
+        game.reset_round()
+        solver.play(game, strategy)
+        wins += game.won
+        moves += game.attempts
+    elapsed = time.perf_counter() - start
+    print(f"{strategy}: {rounds} games, win rate {wins / rounds:.1%}, {elapsed / moves * 1e6:.0f} us per move")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+# startup.py
+# Startup timings (imports, display, fonts, word list, first frame),
+# printed like python3 -X importtime when HANGMAN_STARTUP_REPORT=1.
+# Import this module first: the clock starts when it is imported.
+
+import os
+import sys
+import time
+from contextlib import contextmanager
+
+ENABLED = os.environ.get("HANGMAN_STARTUP_REPORT") == "1"
+START = time.perf_counter()
+phases = []      # (name, seconds)
+milestones = []  # (name, seconds since start)
+
+@contextmanager
+def phase(name):
+    t = time.perf_counter()
+    try:
+        yield
+    finally:
+        phases.append((name, time.perf_counter() - t))
+
+def milestone(name):
+    """Record the time since start, e.g. "first frame"."""
+    milestones.append((name, time.perf_counter() - START))
+
+def report(file=None):
+    if not ENABLED:
+        return
+    file = file if file is not None else sys.stderr
+    print("startup: phase                         |    ms", file=file)
+    for name, seconds in phases:
+        print(f"startup: {name:30s}| {seconds * 1000:8.1f}", file=file)
+    for name, seconds in milestones:
+        print(f"startup: {'[' + name + ']':30s}| {seconds * 1000:8.1f} since start", file=file)
@@ -0,0 +1,189 @@
+# tournament.py
+# Plays every word of a word list with several guessing strategies, at each
+# difficulty, with the rules of hangman_engine.py (1 per wrong letter,
+# 5 per wrong word, max_penalty 12). The words are split in shards played
+# by a pool of processes, each process loads the word list once.
+# Usage:
+#   python3 tournament.py [words.txt] [--strategies random,frequency,hint,solver]
+#                         [--difficulties easy,medium,hard] [--workers N] [--seed 0] [--index]
+#   --index: difficulties from difficulty_index.py instead of the word length
+#
+# Strategies:
+#   random     random letter not tried yet
+#   frequency  letters in English frequency order
+#   hint       only the H key of hangman_pygame.py without numpy (random hint, HINT_PENALTY attempts each)
+#   solver     solver.py, frequency of the letters in the words still possible (needs numpy)
+#   entropy    solver.py, information gain (needs numpy)
+
+import argparse
+import os
+import random
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from hangman_engine import HangmanGame
+from word_pool import WordPool, DEFAULT_WORDS
+
+ALPHABET = "abcdefghijklmnopqrstuvwxyz"
+ENGLISH_ORDER = "etaoinshrdlcumwfgypbvkjxqz"
+SHARDS_PER_WORKER = 8
+
+# ---------- Strategies ----------
+# each one plays the round until it is finished
+
+def play_random(game, rng, solver):
+    letters = list(ALPHABET)
+    rng.shuffle(letters)
+    for letter in letters:
+        if game.finished:
+            break
+        game.guess(letter)
+
+def play_frequency(game, rng, solver):
+    for letter in ENGLISH_ORDER:
+        if game.finished:
+            break
+        game.guess(letter)
+
+def play_hint(game, rng, solver):
+    while not game.finished:
+        if game.hint() is None:
+            break
+
+def play_solver(game, rng, solver):
+    solver.play(game, "frequency")
+
+def play_entropy(game, rng, solver):
+    solver.play(game, "entropy")
+
+STRATEGIES = {
+    "random": play_random,
+    "frequency": play_frequency,
+    "hint": play_hint,
+    "solver": play_solver,
+    "entropy": play_entropy,
+}
+NEEDS_SOLVER = {"solver", "entropy"}
+
+# ---------- Worker side ----------
+# set once per process by init_worker()
+worker_pool = None
+worker_solver = None
+
+def load_words(path):
+    if path is None:
+        return DEFAULT_WORDS
+    from corpus_cache import load_corpus
+    return load_corpus(path)
+
+def make_pool(path, use_index):
+    pool = WordPool(load_words(path))
+    if use_index:
+        from difficulty_index import difficulty_index, apply_index
+        if not apply_index(pool, difficulty_index(pool)) and __name__ == "__main__":
+            print("difficulty index not in order for this word list, word length used instead")
+    return pool
+
+def init_worker(path, need_solver, use_index):
+    global worker_pool, worker_solver
+    worker_pool = make_pool(path, use_index)
+    if need_solver:
+        from solver import Solver
+        worker_solver = Solver(worker_pool.words)
+
+def play_shard(task):
+    """Plays the words bucket[start:stop] of one difficulty with one strategy.
+    Returns (strategy, difficulty, games, wins, Counter of attempts of the won games)."""
+    strategy, difficulty, start, stop, seed = task
+    rng = random.Random(f"{seed}-{strategy}-{difficulty}-{start}")
+    play = STRATEGIES[strategy]
+    bucket = worker_pool.bucket(difficulty) or range(len(worker_pool))
+    words = worker_pool.words
+    game = HangmanGame(secret="a", clock=lambda: 0.0, rng=rng)
+    wins = 0
+    attempts = Counter()
+    for i in bucket[start:stop]:
+        game.reset_round(words[i])
+        play(game, rng, worker_solver)
+        if game.won:
+            wins += 1
+            attempts[game.attempts] += 1
+    return strategy, difficulty, stop - start, wins, attempts
+
+# ---------- Tournament ----------
+def run(path, strategies, difficulties, workers=None, seed=0, use_index=False):
+    workers = workers or os.cpu_count() or 1
+    # built here first: the workers find the difficulty index already saved
+    pool = make_pool(path, use_index)
+    tasks = []
+    for difficulty in difficulties:
+        size = len(pool.bucket(difficulty) or pool.words)
+        step = max(1, -(-size // (workers * SHARDS_PER_WORKER)))
+        for strategy in strategies:
+            for start in range(0, size, step):
+                tasks.append((strategy, difficulty, start, min(start + step, size), seed))
+    need_solver = any(s in NEEDS_SOLVER for s in strategies)
+    results = {}
+    with ProcessPoolExecutor(workers, initializer=init_worker, initargs=(path, need_solver, use_index)) as executor:
+        for strategy, difficulty, games, wins, attempts in executor.map(play_shard, tasks):
+            total = results.setdefault((strategy, difficulty), [0, 0, Counter()])
+            total[0] += games
+            total[1] += wins
+            total[2].update(attempts)
+    return results
+
+def percentile(counter, p):
+    """p-th percentile of a Counter {value: count}."""
+    total = sum(counter.values())
+    if not total:
+        return None
+    rank = total * p / 100
+    seen = 0
+    for value in sorted(counter):
+        seen += counter[value]
+        if seen >= rank:
+            return value
+
+def report(results, strategies, difficulties):
+    print(f"{'strategy':10s} {'difficulty':10s} {'games':>8s} {'win rate':>9s} "
+          f"{'attempts':>9s} {'p50':>4s} {'p90':>4s} {'max':>4s}")
+    for strategy in strategies:
+        for difficulty in difficulties:
+            games, wins, attempts = results[strategy, difficulty]
+            mean = sum(a * n for a, n in attempts.items()) / wins if wins else 0
+            top = max(attempts) if attempts else "-"
+            print(f"{strategy:10s} {difficulty:10s} {games:8d} {wins / games:9.1%} {mean:9.2f} "
+                  f"{percentile(attempts, 50) or '-':>4} {percentile(attempts, 90) or '-':>4} {top:>4}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Hangman strategies tournament over a whole word list")
+    parser.add_argument("words", nargs="?", help="word list file (default: built-in list)")
+    parser.add_argument("--strategies", default="random,frequency,hint,solver",
+                        help="comma separated list of: " + ",".join(STRATEGIES))
+    parser.add_argument("--difficulties", default="easy,medium,hard")
+    parser.add_argument("--workers", type=int, default=None, help="processes (default: one per core)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--index", action="store_true", help="use the difficulty index (difficulty_index.py)")
+    args = parser.parse_args()
+
+    strategies = args.strategies.split(",")
+    for name in strategies:
+        if name not in STRATEGIES:
+            parser.error(f"unknown strategy: {name}")
+    if any(s in NEEDS_SOLVER for s in strategies):
+        try:
+            import numpy  # noqa: F401
+        except ImportError:
+            print("numpy not installed, skipping: " + ",".join(s for s in strategies if s in NEEDS_SOLVER))
+            strategies = [s for s in strategies if s not in NEEDS_SOLVER]
+    difficulties = args.difficulties.split(",")
+
+    start = time.perf_counter()
+    results = run(args.words, strategies, difficulties, args.workers, args.seed, args.index)
+    elapsed = time.perf_counter() - start
+    games = sum(r[0] for r in results.values())
+    report(results, strategies, difficulties)
+    print(f"{games} games in {elapsed:.2f} s ({games / elapsed:,.0f} games/s)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+# word_pool.py
+# Word pool built once when the word list is loaded.
+# Words are indexed by length, each difficulty keeps its own bucket of indices,
+# so picking a word is O(1) instead of filtering the whole list every round.
+# In "deck" mode every bucket is shuffled once and dealt card by card,
+# so a word does not come back before the whole bucket has been played.
+
+import random
+
+# built-in small list, used when no word list is available
+DEFAULT_WORDS = ["python","hangman","computer","programming","challenge","apple","banana","developer","keyboard","mouse"]
+
+# difficulty -> rule on the word length (same rules as before: <=5 easy, >=7 hard)
+DIFFICULTY_RULES = {
+    "easy": lambda n: n <= 5,
+    "medium": lambda n: True,
+    "hard": lambda n: n >= 7,
+}
+
+class WordPool:
+    def __init__(self, words, rules=None, deck=False, rng=None):
+        self.deck = deck
+        self.rng = rng if rng is not None else random.Random()
+        if hasattr(words, "length_ranges"):
+            # compiled corpus (corpus_cache.py): already lowercase and sorted by length,
+            # nothing to scan, each length is a range of indices
+            self.words = words
+            self.by_length = words.length_ranges()
+        else:
+            self.words = [w.lower() for w in words]
+            # length -> indices of the words of that length
+            self.by_length = {}
+            for i, w in enumerate(self.words):
+                self.by_length.setdefault(len(w), []).append(i)
+        # difficulty -> indices, and the current deck of each difficulty
+        self.buckets = {}
+        self.decks = {}
+        for name, rule in (rules or DIFFICULTY_RULES).items():
+            self.add_difficulty(name, rule)
+
+    def __len__(self):
+        return len(self.words)
+
+    def add_difficulty(self, name, rule):
+        """Register a difficulty from a rule on the word length.
+        The rule is only called once per distinct length, the words are not rescanned."""
+        parts = [self.by_length[length] for length in sorted(self.by_length) if rule(length)]
+        if parts and all(isinstance(p, range) for p in parts) and all(
+                a.stop == b.start for a, b in zip(parts, parts[1:])):
+            # consecutive ranges (compiled corpus): keep a single range, no list to build
+            self.set_bucket(name, range(parts[0].start, parts[-1].stop))
+            return
+        indices = []
+        for part in parts:
+            indices.extend(part)
+        self.set_bucket(name, indices)
+
+    def set_bucket(self, name, indices):
+        """Register a difficulty from an already computed list (or range) of word indices."""
+        self.buckets[name] = indices if isinstance(indices, range) else list(indices)
+        self.decks.pop(name, None)
+
+    def bucket(self, difficulty):
+        # unknown or empty difficulty -> whole list (old behaviour)
+        indices = self.buckets.get(difficulty)
+        if not indices:
+            return None
+        return indices
+
+    def draw(self, difficulty="medium"):
+        return self.words[self.draw_index(difficulty)]
+
+    def draw_index(self, difficulty="medium"):
+        """Same as draw() but returns the index of the word in self.words."""
+        indices = self.bucket(difficulty)
+        if indices is None:
+            if not self.words:
+                raise ValueError("Word pool is empty")
+            return self.rng.randrange(len(self.words))
+        if not self.deck:
+            return indices[self.rng.randrange(len(indices))]
+        cards = self.decks.get(difficulty)
+        if not cards:
+            # new deck: shuffle once, then every draw is a pop()
+            cards = list(indices)
+            self.rng.shuffle(cards)
+            self.decks[difficulty] = cards
+        return cards.pop()
+
+    def words_of_length(self, length):
+        return [self.words[i] for i in self.by_length.get(length, [])]
@@ -0,0 +1,110 @@
+# wordlist.py
+# Word list files read without loading them in memory.
+#
+# - iter_words(path): one pass, each line is stripped and checked once
+# - reservoir_sample(path, k): k random words in one pass, constant memory
+# - random_word(path): one random word in a few seeks on the memory-mapped
+#   file (no full read, so a game starts at once even with a huge file)
+# - LineIndex(path): offsets of the valid lines, for random access by number
+
+import mmap
+import random
+from array import array
+
+def iter_words(path):
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            w = line.strip()
+            if w.isalpha():
+                yield w.lower()
+
+def load_words(path):
+    return list(iter_words(path))
+
+def reservoir_sample(path, k=1, rng=None):
+    """k words taken at random (uniformly) in one pass over the file.
+    Returns fewer than k words if the file does not have that many."""
+    rng = rng if rng is not None else random
+    sample = []
+    for i, w in enumerate(iter_words(path)):
+        if i < k:
+            sample.append(w)
+        else:
+            j = rng.randrange(i + 1)
+            if j < k:
+                sample[j] = w
+    return sample
+
+def clean(raw):
+    # bytes of one line -> word, or None if it is not a valid word
+    try:
+        w = raw.decode("utf-8").strip()
+    except UnicodeDecodeError:
+        return None
+    return w.lower() if w.isalpha() else None
+
+def random_word(path, rng=None, tries=1000):
+    """One random word, chosen uniformly among the valid lines, without reading the file:
+    a random byte is picked, its line is kept with a probability inversely
+    proportional to its length (long lines are more likely to be hit).
+    Falls back to reservoir_sample() when nothing is found (few valid lines).
+    Returns None if the file has no valid word."""
+    rng = rng if rng is not None else random
+    with open(path, "rb") as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            return None  # empty file
+        with mm:
+            size = len(mm)
+            for _ in range(tries):
+                pos = rng.randrange(size)
+                start = mm.rfind(b"\n", 0, pos) + 1
+                end = mm.find(b"\n", pos)
+                if end == -1:
+                    end = size
+                if rng.random() * (end - start + 1) >= 2:
+                    continue  # long line: keep it only with probability 2 / (length + 1)
+                w = clean(mm[start:end])
+                if w:
+                    return w
+    sample = reservoir_sample(path, 1, rng)
+    return sample[0] if sample else None
+
+class LineIndex:
+    """Offsets of the valid words of a file, the words themselves stay in the file (mmap)."""
+    def __init__(self, path):
+        self.path = path
+        self.starts = array("Q")
+        self.ends = array("Q")
+        self.file = open(path, "rb")
+        try:
+            self.mm = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self.mm = b""  # empty file
+        mm = self.mm
+        size = len(mm)
+        start = 0
+        while start < size:
+            end = mm.find(b"\n", start)
+            if end == -1:
+                end = size
+            if clean(mm[start:end]):
+                self.starts.append(start)
+                self.ends.append(end)
+            start = end + 1
+
+    def __len__(self):
+        return len(self.starts)
+
+    def __getitem__(self, i):
+        return clean(self.mm[self.starts[i]:self.ends[i]])
+
+    def choice(self, rng=None):
+        rng = rng if rng is not None else random
+        return self[rng.randrange(len(self))]
+
+    def close(self):
+        if isinstance(self.mm, mmap.mmap):
+            self.mm.close()
+        self.file.close()